@@ -8,9 +8,45 @@ import json
 import hashlib
 import random
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from .encoders import get_encoder_class, get_available_techniques
 
+
+def _render_standalone(decoder_code: str, obfuscated_json: str) -> str:
+    """Fill the standalone script skeleton"""
+    return f'''#!/usr/bin/env python3
+"""
+Obfuscated Python Application
+Generated by ObfusLite v1.0.0
+This file contains obfuscated code that will be decoded and executed at runtime
+"""
+
+import base64
+import zlib
+import json
+
+def _decode_and_execute():
+    """Decode and execute the obfuscated application"""
+
+    # Embedded obfuscated data
+    obfuscated_info = json.loads({obfuscated_json!r})
+
+{decoder_code}
+
+    # Decode the layers
+    decoded = obfuscated_info['obfuscated_code']
+    for layer in reversed(range(obfuscated_info['layers'])):
+        metadata = obfuscated_info['layer_metadata'][layer]['metadata']
+        decoded = decode_layer(decoded, metadata)
+
+    # Execute the decoded code in global context
+    exec(decoded, globals())
+
+if __name__ == "__main__":
+    _decode_and_execute()
+'''
+
+
 class Obfuscator:
     """
     Main obfuscation class that provides a simple interface for code obfuscation
@@ -41,50 +77,74 @@ class Obfuscator:
         Returns:
             Dictionary containing obfuscated code and metadata
         """
-        if seed is not None:
-            random.seed(seed)
+        return self.compile_pipeline(technique, layers, seed)(code)
 
+    def compile_pipeline(self, technique: str = 'fast_xor', layers: int = 2,
+                         seed: Optional[int] = None) -> Callable[[str], Dict[str, Any]]:
+        """
+        Build a pre-configured obfuscation callable for repeated use
+
+        The technique lookup and validation happen once here rather than on
+        every call, which matters when obfuscating many files with the same
+        settings.
+
+        Args:
+            technique: Obfuscation technique to use
+            layers: Number of obfuscation layers to apply
+            seed: Random seed for reproducible obfuscation
+
+        Returns:
+            Callable taking Python source code and returning the same
+            dictionary as obfuscate()
+        """
         if technique not in self.techniques:
             available = list(self.techniques.keys())
             raise ValueError(f"Unknown technique '{technique}'. Available: {available}")
 
-        # Validate Python syntax
-        try:
-            ast.parse(code)
-        except SyntaxError as e:
-            raise ValueError(f"Invalid Python code: {e}")
+        encoder = self.techniques[technique]
+
+        def run(code: str) -> Dict[str, Any]:
+            if seed is not None:
+                random.seed(seed)
 
-        # Apply preprocessing
-        processed_code = self._preprocess_code(code)
+            # Validate Python syntax
+            try:
+                ast.parse(code)
+            except SyntaxError as e:
+                raise ValueError(f"Invalid Python code: {e}")
+
+            # Apply preprocessing
+            processed_code = self._preprocess_code(code)
+
+            # Apply multiple layers of obfuscation
+            obfuscated_data = processed_code
+            layer_metadata = []
+
+            for layer in range(layers):
+                result = encoder.encode(obfuscated_data)
+                obfuscated_data = result['encoded']
+                layer_metadata.append({
+                    'layer': layer + 1,
+                    'technique': technique,
+                    'metadata': result.get('metadata', {})
+                })
 
-        # Apply multiple layers of obfuscation
-        obfuscated_data = processed_code
-        layer_metadata = []
+            # Generate unique identifier
+            obfuscation_id = hashlib.sha256(
+                f"{technique}_{layers}_{seed}_{len(code)}".encode()
+            ).hexdigest()[:16]
 
-        for layer in range(layers):
-            encoder = self.techniques[technique]
-            result = encoder.encode(obfuscated_data)
-            obfuscated_data = result['encoded']
-            layer_metadata.append({
-                'layer': layer + 1,
+            return {
+                'obfuscated_code': obfuscated_data,
                 'technique': technique,
-                'metadata': result.get('metadata', {})
-            })
-
-        # Generate unique identifier
-        obfuscation_id = hashlib.sha256(
-            f"{technique}_{layers}_{seed}_{len(code)}".encode()
-        ).hexdigest()[:16]
-
-        return {
-            'obfuscated_code': obfuscated_data,
-            'technique': technique,
-            'layers': layers,
-            'obfuscation_id': obfuscation_id,
-            'layer_metadata': layer_metadata,
-            'original_size': len(code),
-            'obfuscated_size': len(str(obfuscated_data))
-        }
+                'layers': layers,
+                'obfuscation_id': obfuscation_id,
+                'layer_metadata': layer_metadata,
+                'original_size': len(code),
+                'obfuscated_size': len(str(obfuscated_data))
+            }
+
+        return run
 
     def deobfuscate(self, obfuscated_data: Dict[str, Any]) -> str:
         """
@@ -136,39 +196,7 @@ class Obfuscator:
         decoder_code = self._get_decoder_template(technique)
 
         # Create the standalone code
-        standalone_code = f'''#!/usr/bin/env python3
-"""
-Obfuscated Python Application
-Generated by ObfusLite v1.0.0
-This file contains obfuscated code that will be decoded and executed at runtime
-"""
-
-import base64
-import zlib
-import json
-
-def _decode_and_execute():
-    """Decode and execute the obfuscated application"""
-
-    # Embedded obfuscated data
-    obfuscated_info = {obfuscated_json}
-
-{decoder_code}
-
-    # Decode the layers
-    decoded = obfuscated_info['obfuscated_code']
-    for layer in reversed(range(obfuscated_info['layers'])):
-        metadata = obfuscated_info['layer_metadata'][layer]['metadata']
-        decoded = decode_layer(decoded, metadata)
-
-    # Execute the decoded code in global context
-    exec(decoded, globals())
-
-if __name__ == "__main__":
-    _decode_and_execute()
-'''
-
-        return standalone_code
+        return _render_standalone(decoder_code, obfuscated_json)
 
     def _preprocess_code(self, code: str) -> str:
         """Preprocess code before obfuscation"""
@@ -212,21 +240,21 @@ if __name__ == "__main__":
             return '''    def decode_layer(encoded_data, metadata):
         """Fast XOR decoder"""
         keys = metadata['keys']
-        compressed = base64.b64decode(encoded_data.encode('ascii'))
-        encoded_bytes = bytearray(zlib.decompress(compressed))
-
-        for i, byte in enumerate(encoded_bytes):
-            key_index = i % len(keys)
-            encoded_bytes[i] = byte ^ keys[key_index]
+        encoded_bytes = base64.b64decode(encoded_data.encode('ascii'))
+        if metadata.get('compressed', True):
+            encoded_bytes = zlib.decompress(encoded_bytes)
 
-        return bytes(encoded_bytes).decode('utf-8')'''
+        n = len(encoded_bytes)
+        mask = (bytes(keys) * (n // len(keys) + 1))[:n]
+        decoded = int.from_bytes(encoded_bytes, 'big') ^ int.from_bytes(mask, 'big')
+        return decoded.to_bytes(n, 'big').decode('utf-8')'''
 
         elif technique == 'fast_base64':
             return '''    def decode_layer(encoded_data, metadata):
         """Fast Base64 decoder"""
         char_map = metadata['char_map']
-        reverse_map = {v: k for k, v in char_map.items()}
-        original_b64 = ''.join(reverse_map.get(c, c) for c in encoded_data)
+        reverse_table = str.maketrans(''.join(char_map.values()), ''.join(char_map.keys()))
+        original_b64 = encoded_data.translate(reverse_table)
         decoded_bytes = base64.b64decode(original_b64.encode('ascii'))
         return decoded_bytes.decode('utf-8')'''
 
@@ -236,18 +264,12 @@ if __name__ == "__main__":
         rotations = metadata['rotations']
         encoded = base64.b64decode(encoded_data.encode('ascii')).decode('utf-8')
 
-        for rotation in reversed(rotations):
-            result = []
-            for char in encoded:
-                if char.isalpha():
-                    base = ord('A') if char.isupper() else ord('a')
-                    rotated = chr((ord(char) - base - rotation) % 26 + base)
-                    result.append(rotated)
-                else:
-                    result.append(char)
-            encoded = ''.join(result)
-
-        return encoded'''
+        shift = -sum(rotations) % 26
+        upper = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+        lower = upper.lower()
+        table = str.maketrans(upper + lower,
+                              upper[shift:] + upper[:shift] + lower[shift:] + lower[:shift])
+        return encoded.translate(table)'''
 
         else:
             # Generic decoder for other techniques
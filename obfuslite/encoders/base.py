@@ -10,6 +10,26 @@ import string
 from abc import ABC, abstractmethod
 from typing import Dict, Any
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class _BitStrings(dict):
+    """Code point to 8-bit binary string table for str.translate"""
+
+    def __missing__(self, code_point: int) -> str:
+        # Code points above 255 keep their full-width binary form
+        return format(code_point, '08b')
+
+
+_BIT_STRINGS = _BitStrings((i, format(i, '08b')) for i in range(256))
+
+# Maps 0/1 byte values to the ASCII digits int() parses
+_BIT_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
 class BaseEncoder(ABC):
     """
     Abstract base class for all encoding techniques
@@ -18,6 +38,9 @@ class BaseEncoder(ABC):
     to provide consistent interface for the obfuscation system.
     """
     
+    # Empty so subclasses that declare __slots__ get no instance __dict__
+    __slots__ = ()
+    
     @abstractmethod
     def encode(self, data: str) -> Dict[str, Any]:
         """
@@ -69,7 +92,43 @@ class BaseEncoder(ABC):
         Returns:
             Random bytes
         """
-        return bytes(random.randint(0, 255) for _ in range(length))
+        # One call for all bits keeps output reproducible under random.seed()
+        return random.getrandbits(8 * length).to_bytes(length, 'little') if length else b''
+        
+    def _to_binary_string(self, data: str) -> str:
+        """
+        Convert a string to its binary representation
+
+        Args:
+            data: String data to convert
+
+        Returns:
+            String of '0'/'1' characters, 8 per character for code points below 256
+        """
+        # A single translate replaces one format() call per character
+        return data.translate(_BIT_STRINGS)
+        
+    def _bits_to_string(self, binary_data: Any, original_length: int) -> str:
+        """
+        Convert a sequence of 0/1 values back to a UTF-8 string
+
+        Args:
+            binary_data: Bit values, most significant first (bytes-like, e.g. a uint8 array)
+            original_length: Number of characters to keep
+
+        Returns:
+            Decoded string, with invalid UTF-8 replaced
+        """
+        # A trailing partial byte is zero-padded
+        if NUMPY_AVAILABLE:
+            data_bytes = np.packbits(np.asarray(binary_data, dtype=np.uint8)).tobytes()
+        else:
+            # Parse all bits as one integer so the work stays in C
+            digits = bytes(binary_data).translate(_BIT_DIGITS)
+            digits += b'0' * (-len(digits) % 8)
+            data_bytes = int(digits, 2).to_bytes(len(digits) // 8, 'big') if digits else b''
+
+        return data_bytes.decode('utf-8', errors='replace')[:original_length]
         
     def _validate_input(self, data: str) -> None:
         """
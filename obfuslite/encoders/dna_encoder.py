@@ -58,7 +58,7 @@ class DnaEncoder(BaseEncoder):
         Encode string data using DNA sequence mapping
         """
         # Convert to binary
-        binary_data = ''.join(format(ord(char), '08b') for char in data)
+        binary_data = self._to_binary_string(data)
 
         # Pad to multiple of 2 for DNA base encoding
         while len(binary_data) % 2 != 0:
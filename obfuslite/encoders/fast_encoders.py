@@ -6,12 +6,68 @@ Optimized versions that are lightweight and fast
 import base64
 import json
 import random
+import re
 import string
 import hashlib
 import zlib
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
 from .base import BaseEncoder
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Fastest zlib level; XORed source still compresses well with it
+XOR_COMPRESSION_LEVEL = 1
+
+# Lookup tokens are '#NNNN#' (wider once there are 10000+ unique characters)
+_LOOKUP_TOKEN_RE = re.compile(r'#\d+#')
+
+
+def _xor_with_keys(data: bytes, keys: List[int]) -> bytes:
+    """XOR data with a repeating key sequence"""
+    # Tile the keys once into a stream as long as the data
+    n = len(data)
+    mask = (bytes(keys) * -(-n // len(keys)))[:n]
+
+    if NUMPY_AVAILABLE:
+        arr = np.frombuffer(data, dtype=np.uint8)
+        return (arr ^ np.frombuffer(mask, dtype=np.uint8)).tobytes()
+
+    # Without NumPy, XOR as one big integer so the loop stays in C
+    return (int.from_bytes(data, 'big') ^ int.from_bytes(mask, 'big')).to_bytes(n, 'big')
+
+
+def _bit_rotation_table(shift: int) -> bytes:
+    """Build a bytes.translate table rotating each byte left by shift bits"""
+    shift %= 8
+    return bytes(((b << shift) | (b >> (8 - shift))) & 0xFF for b in range(256))
+
+
+@lru_cache(maxsize=128)
+def _reverse_mapping(items: Tuple[Tuple[str, str], ...]) -> Dict[str, str]:
+    """Invert a mapping given as sorted (key, value) pairs"""
+    return {v: k for k, v in items}
+
+
+@lru_cache(maxsize=128)
+def _reverse_translation(items: Tuple[Tuple[str, str], ...]) -> Dict[int, int]:
+    """Build a str.translate table undoing a character mapping"""
+    return str.maketrans(_reverse_mapping(items))
+
+
+def _rotation_table(shift: int) -> Dict[int, int]:
+    """Build a str.translate table rotating ASCII letters by shift"""
+    shift %= 26
+    upper = string.ascii_uppercase
+    lower = string.ascii_lowercase
+    return str.maketrans(upper + lower,
+                         upper[shift:] + upper[:shift] + lower[shift:] + lower[:shift])
+
+
 class FastXOREncoder(BaseEncoder):
     """Fast XOR-based encoder with multiple keys"""
 
@@ -23,19 +79,18 @@ class FastXOREncoder(BaseEncoder):
         data_bytes = data.encode('utf-8')
 
         # Apply multiple XOR operations
-        encoded_bytes = bytearray(data_bytes)
-        for i, byte in enumerate(encoded_bytes):
-            key_index = i % len(keys)
-            encoded_bytes[i] = byte ^ keys[key_index]
+        encoded_bytes = _xor_with_keys(data_bytes, keys)
 
-        # Compress and encode
-        compressed = zlib.compress(bytes(encoded_bytes))
-        encoded_b64 = base64.b64encode(compressed).decode('ascii')
+        # Compress and encode, keeping the raw bytes when zlib does not help
+        compressed = zlib.compress(encoded_bytes, XOR_COMPRESSION_LEVEL)
+        is_compressed = len(compressed) < len(encoded_bytes)
+        encoded_b64 = base64.b64encode(compressed if is_compressed else encoded_bytes).decode('ascii')
 
         return {
             'encoded': encoded_b64,
             'metadata': {
                 'keys': keys,
+                'compressed': is_compressed,
                 'original_length': len(data)
             }
         }
@@ -44,15 +99,12 @@ class FastXOREncoder(BaseEncoder):
         keys = metadata['keys']
 
         # Decode and decompress
-        compressed = base64.b64decode(encoded_data.encode('ascii'))
-        encoded_bytes = bytearray(zlib.decompress(compressed))
+        encoded_bytes = base64.b64decode(encoded_data.encode('ascii'))
+        if metadata.get('compressed', True):
+            encoded_bytes = zlib.decompress(encoded_bytes)
 
         # Reverse XOR operations
-        for i, byte in enumerate(encoded_bytes):
-            key_index = i % len(keys)
-            encoded_bytes[i] = byte ^ keys[key_index]
-
-        return bytes(encoded_bytes).decode('utf-8')
+        return _xor_with_keys(encoded_bytes, keys).decode('utf-8')
 
 class FastBase64Encoder(BaseEncoder):
     """Fast Base64 encoder with character substitution"""
@@ -69,7 +121,7 @@ class FastBase64Encoder(BaseEncoder):
         encoded_str = encoded_bytes.decode('ascii')
 
         # Apply character substitution
-        substituted = ''.join(char_map.get(c, c) for c in encoded_str)
+        substituted = encoded_str.translate(str.maketrans(char_map))
 
         return {
             'encoded': substituted,
@@ -83,8 +135,8 @@ class FastBase64Encoder(BaseEncoder):
         char_map = metadata['char_map']
 
         # Reverse character mapping
-        reverse_map = {v: k for k, v in char_map.items()}
-        original_b64 = ''.join(reverse_map.get(c, c) for c in encoded_data)
+        reverse_table = _reverse_translation(tuple(sorted(char_map.items())))
+        original_b64 = encoded_data.translate(reverse_table)
 
         # Decode from base64
         decoded_bytes = base64.b64decode(original_b64.encode('ascii'))
@@ -97,18 +149,8 @@ class FastRotationEncoder(BaseEncoder):
         # Generate rotation parameters
         rotations = [random.randint(1, 25) for _ in range(3)]
 
-        encoded = data
-        for rotation in rotations:
-            # Apply Caesar cipher rotation
-            result = []
-            for char in encoded:
-                if char.isalpha():
-                    base = ord('A') if char.isupper() else ord('a')
-                    rotated = chr((ord(char) - base + rotation) % 26 + base)
-                    result.append(rotated)
-                else:
-                    result.append(char)
-            encoded = ''.join(result)
+        # Apply all Caesar rotations as one net shift
+        encoded = data.translate(_rotation_table(sum(rotations)))
 
         # Encode to base64 for safe storage
         encoded_b64 = base64.b64encode(encoded.encode('utf-8')).decode('ascii')
@@ -127,42 +169,33 @@ class FastRotationEncoder(BaseEncoder):
         # Decode from base64
         encoded = base64.b64decode(encoded_data.encode('ascii')).decode('utf-8')
 
-        # Reverse rotations in reverse order
-        for rotation in reversed(rotations):
-            result = []
-            for char in encoded:
-                if char.isalpha():
-                    base = ord('A') if char.isupper() else ord('a')
-                    rotated = chr((ord(char) - base - rotation) % 26 + base)
-                    result.append(rotated)
-                else:
-                    result.append(char)
-            encoded = ''.join(result)
-
-        return encoded
+        # Reverse the net rotation in one pass
+        return encoded.translate(_rotation_table(-sum(rotations)))
 
 class FastHashEncoder(BaseEncoder):
     """Fast hash-based encoder with lookup table"""
 
     def encode(self, data: str) -> Dict[str, Any]:
-        # Split data into chunks
+        # Encode once, then split into 8-byte chunks
+        data_bytes = data.encode('utf-8')
         chunk_size = 8
-        chunks = [data[i:i+chunk_size] for i in range(0, len(data), chunk_size)]
+        chunks = [data_bytes[i:i+chunk_size] for i in range(0, len(data_bytes), chunk_size)]
 
         # Create hash mapping
         hash_map = {}
         encoded_hashes = []
 
         for chunk in chunks:
-            # Create hash for chunk
-            chunk_hash = hashlib.md5(chunk.encode()).hexdigest()[:8]
-            hash_map[chunk_hash] = chunk
+            # Create hash for chunk (4-byte BLAKE2 digest, 8 hex chars)
+            chunk_hash = hashlib.blake2b(chunk, digest_size=4).hexdigest()
+            hash_map[chunk_hash] = chunk.hex()
             encoded_hashes.append(chunk_hash)
 
         return {
             'encoded': '|'.join(encoded_hashes),
             'metadata': {
                 'hash_map': hash_map,
+                'chunk_format': 'hex',
                 'original_length': len(data)
             }
         }
@@ -175,42 +208,27 @@ class FastHashEncoder(BaseEncoder):
 
         # Reconstruct original data
         chunks = [hash_map[h] for h in hashes if h in hash_map]
-        return ''.join(chunks)
+        if metadata.get('chunk_format') != 'hex':
+            # Older payloads stored the text chunks directly
+            return ''.join(chunks)
+        return bytes.fromhex(''.join(chunks)).decode('utf-8')
 
 class FastBinaryEncoder(BaseEncoder):
     """Fast binary encoder with bit manipulation"""
 
     def encode(self, data: str) -> Dict[str, Any]:
-        # Convert to binary
-        binary = ''.join(format(ord(char), '08b') for char in data)
+        data_bytes = data.encode('utf-8')
 
-        # Apply bit shifts
+        # Rotate the bits of every byte in one C-level pass
         shift = random.randint(1, 7)
-        shifted_bits = []
-
-        for i in range(0, len(binary), 8):
-            byte = binary[i:i+8]
-            if len(byte) == 8:
-                # Shift bits
-                shifted = byte[shift:] + byte[:shift]
-                shifted_bits.append(shifted)
-
-        # Convert back to characters
-        shifted_binary = ''.join(shifted_bits)
-        encoded_chars = []
-
-        for i in range(0, len(shifted_binary), 8):
-            byte = shifted_binary[i:i+8]
-            if len(byte) == 8:
-                encoded_chars.append(chr(int(byte, 2)))
-
-        encoded_str = ''.join(encoded_chars)
-        encoded_b64 = base64.b64encode(encoded_str.encode('latin-1')).decode('ascii')
+        encoded_bytes = data_bytes.translate(_bit_rotation_table(shift))
+        encoded_b64 = base64.b64encode(encoded_bytes).decode('ascii')
 
         return {
             'encoded': encoded_b64,
             'metadata': {
                 'shift': shift,
+                'encoding': 'utf-8',
                 'original_length': len(data)
             }
         }
@@ -218,31 +236,12 @@ class FastBinaryEncoder(BaseEncoder):
     def decode(self, encoded_data: Any, metadata: Dict[str, Any]) -> str:
         shift = metadata['shift']
 
-        # Decode from base64
-        encoded_str = base64.b64decode(encoded_data.encode('ascii')).decode('latin-1')
-
-        # Convert to binary
-        binary = ''.join(format(ord(char), '08b') for char in encoded_str)
-
-        # Reverse bit shifts
-        original_bits = []
-        for i in range(0, len(binary), 8):
-            byte = binary[i:i+8]
-            if len(byte) == 8:
-                # Reverse shift
-                original = byte[-shift:] + byte[:-shift]
-                original_bits.append(original)
-
-        # Convert back to characters
-        original_binary = ''.join(original_bits)
-        chars = []
-
-        for i in range(0, len(original_binary), 8):
-            byte = original_binary[i:i+8]
-            if len(byte) == 8:
-                chars.append(chr(int(byte, 2)))
+        # Decode from base64 and reverse the bit rotation
+        encoded_bytes = base64.b64decode(encoded_data.encode('ascii'))
+        original_bytes = encoded_bytes.translate(_bit_rotation_table(8 - shift))
 
-        return ''.join(chars)
+        # Older payloads stored one latin-1 character per byte
+        return original_bytes.decode(metadata.get('encoding', 'latin-1'))
 
 class FastLookupEncoder(BaseEncoder):
     """Fast lookup table encoder"""
@@ -273,26 +272,11 @@ class FastLookupEncoder(BaseEncoder):
         lookup_table = metadata['lookup_table']
 
         # Reverse lookup table
-        reverse_table = {v: k for k, v in lookup_table.items()}
+        reverse_table = _reverse_mapping(tuple(sorted(lookup_table.items())))
 
         # Decode using reverse lookup
-        decoded_chars = []
-        i = 0
-        while i < len(encoded_data):
-            if encoded_data[i] == '#':
-                # Find the complete token
-                end = encoded_data.find('#', i + 1)
-                if end != -1:
-                    token = encoded_data[i:end+1]
-                    if token in reverse_table:
-                        decoded_chars.append(reverse_table[token])
-                    i = end + 1
-                else:
-                    i += 1
-            else:
-                i += 1
-
-        return ''.join(decoded_chars)
+        tokens = _LOOKUP_TOKEN_RE.findall(encoded_data)
+        return ''.join([reverse_table[token] for token in tokens if token in reverse_table])
 
 # Registry of fast encoders
 FAST_ENCODERS = {
@@ -5,11 +5,214 @@ Uses mathematical fractals and chaos theory for encoding
 
 import numpy as np
 import base64
+import io
 import json
 import math
-from typing import Dict, Any, List, Tuple
+import random
+from typing import Dict, Any, Tuple
 from .base import BaseEncoder
 
+# Optional JIT compiler for the per-point fractal and chaos kernels
+try:
+    from numba import njit, prange, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Point count from which the escape-time kernel is spread across cores;
+# below it the thread start-up cost outweighs the work
+PARALLEL_MIN_POINTS = 4096
+
+
+if NUMBA_AVAILABLE:
+    # Kernels are declared with explicit signatures so they are compiled (or
+    # loaded from the on-disk cache) at import rather than on first call
+    _READONLY_BYTES = types.Array(types.uint8, 1, 'C', readonly=True)
+
+    @njit('Tuple((int64, float64, float64))(float64, float64, float64, float64, float64, int64)',
+          cache=True)
+    def _escape_point(zr, zi, cr, ci, escape_sq, max_iter):
+        """Escape-time loop for one point, with explicit real/imag floats"""
+        it = 0
+        while zr * zr + zi * zi < escape_sq and it < max_iter:
+            zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+            it += 1
+        return it, zr, zi
+
+    @njit('Tuple((int64[:], float64[:], float64[:]))'
+          '(float64[:], float64[:], float64[:], float64[:], float64, int64)', cache=True)
+    def _escape_time_kernel(zr0, zi0, cr, ci, escape_radius, max_iter):
+        """Per-point escape-time loop over all points"""
+        n = zr0.size
+        iterations = np.zeros(n, dtype=np.int64)
+        zr_out = np.empty(n)
+        zi_out = np.empty(n)
+        escape_sq = escape_radius * escape_radius
+
+        for i in range(n):
+            iterations[i], zr_out[i], zi_out[i] = _escape_point(
+                zr0[i], zi0[i], cr[i], ci[i], escape_sq, max_iter)
+
+        return iterations, zr_out, zi_out
+
+    @njit('Tuple((int64[:], float64[:], float64[:]))'
+          '(float64[:], float64[:], float64[:], float64[:], float64, int64)',
+          parallel=True, cache=True)
+    def _escape_time_kernel_parallel(zr0, zi0, cr, ci, escape_radius, max_iter):
+        """Same as _escape_time_kernel, with the points split across threads"""
+        n = zr0.size
+        iterations = np.zeros(n, dtype=np.int64)
+        zr_out = np.empty(n)
+        zi_out = np.empty(n)
+        escape_sq = escape_radius * escape_radius
+
+        for i in prange(n):
+            iterations[i], zr_out[i], zi_out[i] = _escape_point(
+                zr0[i], zi0[i], cr[i], ci[i], escape_sq, max_iter)
+
+        return iterations, zr_out, zi_out
+
+    @njit('float64[:, :](uint8[:], float64[:, :], float64, float64, float64, float64, float64)',
+          cache=True)
+    def _sierpinski_kernel(bits, vertices, x, y, scale, cos_r, sin_r):
+        """Chaos-game walk towards the vertex picked by each bit"""
+        n = bits.size
+        out = np.empty((n, 2))
+
+        for i in range(n):
+            vertex = (bits[i] + i) % 3
+            x = (x + vertices[vertex, 0]) * scale
+            y = (y + vertices[vertex, 1]) * scale
+            out[i, 0] = x * cos_r - y * sin_r
+            out[i, 1] = x * sin_r + y * cos_r
+
+        return out
+
+    @njit('float64[:, :](uint8[:], float64, float64, float64, float64)', cache=True)
+    def _lorenz_kernel(bits, sigma, rho, beta, dt):
+        """Euler-integrate the Lorenz system, nudging x and y on 1 bits"""
+        n = bits.size
+        out = np.empty((n, 3))
+        x = y = z = 1.0
+
+        for i in range(n):
+            dx = sigma * (y - x)
+            dy = x * (rho - z) - y
+            dz = x * y - beta * z
+            x += dx * dt
+            y += dy * dt
+            z += dz * dt
+
+            # Branchless perturbation; adding 0.0 leaves the value unchanged
+            x += 0.1 * bits[i]
+            y += 0.1 * bits[i]
+
+            out[i, 0] = x
+            out[i, 1] = y
+            out[i, 2] = z
+
+        return out
+
+    @njit(types.uint8[::1](_READONLY_BYTES, types.float64, types.float64), cache=True)
+    def _chaos_xor_kernel(buf, x0, r):
+        """XOR each byte with the next value of a logistic-map sequence"""
+        out = np.empty_like(buf)
+        x = x0
+        for i in range(buf.size):
+            x = r * x * (1 - x)
+            out[i] = buf[i] ^ (int(x * 256) % 256)
+        return out
+
+
+def _escape_time(zr: np.ndarray, zi: np.ndarray, cr: np.ndarray, ci: np.ndarray,
+                 escape_radius: float, max_iter: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Iterate z = z*z + c for every point until it escapes or hits max_iter
+
+    Returns the iteration counts and the final real and imaginary parts.
+    """
+    if NUMBA_AVAILABLE:
+        kernel = _escape_time_kernel_parallel if zr.size >= PARALLEL_MIN_POINTS else _escape_time_kernel
+        return kernel(zr, zi, cr, ci, float(escape_radius), int(max_iter))
+
+    # Without Numba, iterate the points that have not escaped yet together.
+    # Their real/imaginary parts are kept compacted in contiguous arrays and
+    # updated in place through preallocated buffers; escape is tested on the
+    # squared magnitude, as in the compiled kernel.
+    zr = zr.copy()
+    zi = zi.copy()
+    iterations = np.zeros(zr.size, dtype=np.int64)
+    escape_sq = escape_radius * escape_radius
+
+    live = np.flatnonzero(zr * zr + zi * zi < escape_sq)
+    live_zr, live_zi, live_cr, live_ci = zr[live], zi[live], cr[live], ci[live]
+    buf_a = np.empty(live.size)
+    buf_b = np.empty(live.size)
+    still_live = np.empty(live.size, dtype=bool)
+
+    step = 0
+    for step in range(1, max_iter + 1):
+        k = live.size
+        if k == 0:
+            break
+        a, b, keep = buf_a[:k], buf_b[:k], still_live[:k]
+
+        # z = z*z + c
+        np.multiply(live_zi, live_zi, out=a)
+        np.multiply(live_zr, live_zi, out=b)
+        np.multiply(live_zr, live_zr, out=live_zr)
+        np.subtract(live_zr, a, out=live_zr)
+        np.add(live_zr, live_cr, out=live_zr)
+        np.add(b, b, out=live_zi)
+        np.add(live_zi, live_ci, out=live_zi)
+
+        # |z|^2 < escape_radius^2
+        np.multiply(live_zr, live_zr, out=a)
+        np.multiply(live_zi, live_zi, out=b)
+        np.add(a, b, out=a)
+        np.less(a, escape_sq, out=keep)
+
+        if not keep.all():
+            # Record escaped points and drop them from the working set
+            escaped = ~keep
+            done = live[escaped]
+            iterations[done] = step
+            zr[done] = live_zr[escaped]
+            zi[done] = live_zi[escaped]
+            live = live[keep]
+            live_zr, live_zi = live_zr[keep], live_zi[keep]
+            live_cr, live_ci = live_cr[keep], live_ci[keep]
+
+    # Points still bounded ran for every iteration
+    iterations[live] = step
+    zr[live] = live_zr
+    zi[live] = live_zi
+
+    return iterations, zr, zi
+
+
+def _chaos_keystream(length: int, x0: float, r: float) -> np.ndarray:
+    """Return the first length key bytes of the logistic map started at x0"""
+    stream = bytearray(length)
+    x = x0
+    for i in range(length):
+        x = r * x * (1 - x)
+        stream[i] = int((x * 256)) % 256
+
+    return np.frombuffer(stream, dtype=np.uint8)
+
+
+def _chaos_xor(data: bytes, x0: float, r: float) -> bytes:
+    """XOR data with the logistic map x = r*x*(1-x) started at x0
+
+    The mapping is its own inverse, so it both applies and removes chaos.
+    """
+    if NUMBA_AVAILABLE:
+        return _chaos_xor_kernel(np.frombuffer(data, dtype=np.uint8), x0, r).tobytes()
+
+    # The recurrence is sequential, so the keystream is generated up front
+    return (np.frombuffer(data, dtype=np.uint8) ^ _chaos_keystream(len(data), x0, r)).tobytes()
+
+
 class FractalEncoder(BaseEncoder):
     """
     Fractal-based encoder that uses mathematical fractals
@@ -24,16 +227,20 @@ class FractalEncoder(BaseEncoder):
             'dragon': self._dragon_encode,
             'lorenz': self._lorenz_encode
         }
+        self._fractal_names = tuple(self.fractal_types)
+
+        # Per-instance generator for all parameter draws
+        self._rng = np.random.default_rng()
 
     def encode(self, data: str) -> Dict[str, Any]:
         """
         Encode string data using fractal patterns
         """
-        # Convert to binary
-        binary_data = ''.join(format(ord(char), '08b') for char in data)
+        # Convert to a 0/1 bit array
+        binary_data = np.unpackbits(np.frombuffer(data.encode('utf-8'), dtype=np.uint8))
 
         # Choose random fractal type
-        fractal_type = np.random.choice(list(self.fractal_types.keys()))
+        fractal_type = random.choice(self._fractal_names)
 
         # Generate fractal parameters
         fractal_params = self._generate_fractal_params(fractal_type)
@@ -42,14 +249,14 @@ class FractalEncoder(BaseEncoder):
         fractal_data = self.fractal_types[fractal_type](binary_data, fractal_params)
 
         # Apply chaos mapping for additional security
-        chaos_data = self._apply_chaos_mapping(fractal_data)
+        chaos_data = self._apply_chaos_mapping(self._pack_fractal_data(fractal_data))
 
         # Create fractal coordinate system
         coordinate_system = self._create_coordinate_system(len(binary_data))
 
         # Encode as base64
         encoded_data = base64.b64encode(json.dumps({
-            'fractal_data': chaos_data,
+            'fractal_data': base64.b64encode(chaos_data).decode('ascii'),
             'coordinate_system': coordinate_system
         }).encode()).decode()
 
@@ -59,7 +266,8 @@ class FractalEncoder(BaseEncoder):
                 'fractal_type': fractal_type,
                 'fractal_params': fractal_params,
                 'original_length': len(data),
-                'binary_length': len(binary_data)
+                'binary_length': len(binary_data),
+                'payload_format': 'npz'
             }
         }
 
@@ -70,8 +278,14 @@ class FractalEncoder(BaseEncoder):
         # Decode from base64
         fractal_info = json.loads(base64.b64decode(encoded_data.encode()).decode())
 
-        # Reverse chaos mapping
-        fractal_data = self._reverse_chaos_mapping(fractal_info['fractal_data'])
+        # Reverse chaos mapping; the XOR mapping is its own inverse
+        if metadata.get('payload_format') == 'npz':
+            chaos_data = base64.b64decode(fractal_info['fractal_data'])
+            fractal_data = self._unpack_fractal_data(self._apply_chaos_mapping(chaos_data))
+        else:
+            # Older payloads chaos-mapped the JSON text of the points
+            chaos_data = fractal_info['fractal_data'].encode('latin-1')
+            fractal_data = json.loads(self._apply_chaos_mapping(chaos_data).decode('latin-1'))
 
         # Decode using fractal type
         fractal_type = metadata['fractal_type']
@@ -80,184 +294,162 @@ class FractalEncoder(BaseEncoder):
         binary_data = self._fractal_decode(fractal_data, fractal_type, fractal_params)
 
         # Convert binary to string
-        original_data = self._binary_to_string(binary_data, metadata['original_length'])
+        original_data = self._bits_to_string(binary_data, metadata['original_length'])
 
         return original_data
 
     def _generate_fractal_params(self, fractal_type: str) -> Dict[str, Any]:
         """Generate parameters for the specified fractal type"""
+        # Continuous parameters are drawn in one batched call per fractal type
         if fractal_type == 'mandelbrot':
+            escape_radius, zoom, center_x, center_y = self._rng.uniform(
+                (2.0, 0.5, -2, -2), (4.0, 2.0, 2, 2)).tolist()
             return {
-                'max_iter': np.random.randint(50, 200),
-                'escape_radius': np.random.uniform(2.0, 4.0),
-                'zoom': np.random.uniform(0.5, 2.0),
-                'center': (np.random.uniform(-2, 2), np.random.uniform(-2, 2))
+                'max_iter': int(self._rng.integers(50, 200)),
+                'escape_radius': escape_radius,
+                'zoom': zoom,
+                'center': (center_x, center_y)
             }
         elif fractal_type == 'julia':
+            c_real, c_imag, escape_radius = self._rng.uniform((-2, -2, 2.0), (2, 2, 4.0)).tolist()
             return {
-                'c_real': np.random.uniform(-2, 2),
-                'c_imag': np.random.uniform(-2, 2),
-                'max_iter': np.random.randint(50, 200),
-                'escape_radius': np.random.uniform(2.0, 4.0)
+                'c_real': c_real,
+                'c_imag': c_imag,
+                'max_iter': int(self._rng.integers(50, 200)),
+                'escape_radius': escape_radius
             }
         elif fractal_type == 'sierpinski':
+            scale, rotation = self._rng.uniform((0.3, 0), (0.7, 2 * np.pi)).tolist()
             return {
-                'iterations': np.random.randint(5, 15),
-                'scale': np.random.uniform(0.3, 0.7),
-                'rotation': np.random.uniform(0, 2 * np.pi)
+                'iterations': int(self._rng.integers(5, 15)),
+                'scale': scale,
+                'rotation': rotation
             }
         elif fractal_type == 'dragon':
+            angle, scale = self._rng.uniform((np.pi/3, 0.5), (2*np.pi/3, 1.5)).tolist()
             return {
-                'iterations': np.random.randint(8, 16),
-                'angle': np.random.uniform(np.pi/3, 2*np.pi/3),
-                'scale': np.random.uniform(0.5, 1.5)
+                'iterations': int(self._rng.integers(8, 16)),
+                'angle': angle,
+                'scale': scale
             }
         elif fractal_type == 'lorenz':
+            sigma, rho, beta, dt = self._rng.uniform((8, 25, 2.5, 0.01), (12, 30, 3.0, 0.02)).tolist()
             return {
-                'sigma': np.random.uniform(8, 12),
-                'rho': np.random.uniform(25, 30),
-                'beta': np.random.uniform(2.5, 3.0),
-                'dt': np.random.uniform(0.01, 0.02)
+                'sigma': sigma,
+                'rho': rho,
+                'beta': beta,
+                'dt': dt
             }
 
-    def _mandelbrot_encode(self, binary_data: str, params: Dict[str, Any]) -> List[Dict]:
-        """Encode data using Mandelbrot set"""
-        encoded_points = []
+    def _mandelbrot_encode(self, binary_data: np.ndarray, params: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """Encode data using Mandelbrot set
 
-        for i, bit in enumerate(binary_data):
-            # Map bit to complex plane position
-            angle = (i / len(binary_data)) * 2 * np.pi
-            radius = 0.5 if bit == '0' else 1.5
-
-            # Create complex number
-            c = complex(
-                params['center'][0] + radius * np.cos(angle) * params['zoom'],
-                params['center'][1] + radius * np.sin(angle) * params['zoom']
-            )
-
-            # Calculate Mandelbrot iterations
-            z = 0
-            iterations = 0
-            while abs(z) < params['escape_radius'] and iterations < params['max_iter']:
-                z = z*z + c
-                iterations += 1
-
-            # Encode the result
-            encoded_points.append({
-                'c_real': c.real,
-                'c_imag': c.imag,
-                'iterations': iterations,
-                'final_z_real': z.real,
-                'final_z_imag': z.imag
-            })
+        All points are iterated together; each step only updates the points
+        that have not escaped yet.
+        """
+        n = binary_data.size
 
-        return encoded_points
+        # Map each bit to a complex plane position
+        angles = (np.arange(n) / n) * 2 * np.pi
+        radius = np.where(binary_data, 1.5, 0.5)
+        c_real = params['center'][0] + radius * np.cos(angles) * params['zoom']
+        c_imag = params['center'][1] + radius * np.sin(angles) * params['zoom']
 
-    def _julia_encode(self, binary_data: str, params: Dict[str, Any]) -> List[Dict]:
-        """Encode data using Julia set"""
-        encoded_points = []
-        c = complex(params['c_real'], params['c_imag'])
+        # Calculate Mandelbrot iterations
+        iterations, z_real, z_imag = _escape_time(
+            np.zeros(n), np.zeros(n), c_real, c_imag,
+            params['escape_radius'], params['max_iter'])
 
-        for i, bit in enumerate(binary_data):
-            # Map bit to initial z value
-            angle = (i / len(binary_data)) * 2 * np.pi
-            radius = 0.5 if bit == '0' else 1.5
+        # Encode the result as parallel columns
+        return {
+            'c_real': c_real,
+            'c_imag': c_imag,
+            'iterations': iterations,
+            'final_z_real': z_real,
+            'final_z_imag': z_imag
+        }
 
-            z = complex(radius * np.cos(angle), radius * np.sin(angle))
+    def _julia_encode(self, binary_data: np.ndarray, params: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """Encode data using Julia set"""
+        n = binary_data.size
 
-            # Calculate Julia iterations
-            iterations = 0
-            while abs(z) < params['escape_radius'] and iterations < params['max_iter']:
-                z = z*z + c
-                iterations += 1
+        # Map each bit to an initial z value
+        angles = (np.arange(n) / n) * 2 * np.pi
+        radius = np.where(binary_data, 1.5, 0.5)
 
-            encoded_points.append({
-                'z_real': z.real,
-                'z_imag': z.imag,
-                'iterations': iterations
-            })
+        # Calculate Julia iterations
+        iterations, z_real, z_imag = _escape_time(
+            radius * np.cos(angles), radius * np.sin(angles),
+            np.full(n, params['c_real']), np.full(n, params['c_imag']),
+            params['escape_radius'], params['max_iter'])
 
-        return encoded_points
+        return {
+            'z_real': z_real,
+            'z_imag': z_imag,
+            'iterations': iterations
+        }
 
-    def _sierpinski_encode(self, binary_data: str, params: Dict[str, Any]) -> List[Tuple]:
+    def _sierpinski_encode(self, binary_data: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
         """Encode data using Sierpinski triangle"""
-        encoded_points = []
-
         # Define triangle vertices
-        vertices = [
+        vertices = np.array([
             (0, 0),
             (1, 0),
             (0.5, np.sqrt(3)/2)
-        ]
+        ])
 
         # Start at random point
-        current_point = (np.random.random(), np.random.random())
+        x, y = self._rng.random(2).tolist()
 
-        for bit in binary_data:
-            # Choose vertex based on bit pattern
-            vertex_index = int(bit)
-            if len(encoded_points) > 0:
-                # Use previous point for more complex mapping
-                vertex_index = (vertex_index + len(encoded_points)) % 3
+        # The rotation is fixed, so its sine and cosine are computed once
+        scale = float(params['scale'])
+        cos_r = math.cos(params['rotation'])
+        sin_r = math.sin(params['rotation'])
 
-            target_vertex = vertices[vertex_index]
+        if NUMBA_AVAILABLE:
+            return _sierpinski_kernel(binary_data, vertices, x, y, scale, cos_r, sin_r)
 
-            # Move halfway to chosen vertex
-            new_point = (
-                (current_point[0] + target_vertex[0]) * params['scale'],
-                (current_point[1] + target_vertex[1]) * params['scale']
-            )
+        encoded_points = np.empty((binary_data.size, 2))
+        vertex_rows = vertices.tolist()
 
-            # Apply rotation
-            rotated_point = (
-                new_point[0] * np.cos(params['rotation']) - new_point[1] * np.sin(params['rotation']),
-                new_point[0] * np.sin(params['rotation']) + new_point[1] * np.cos(params['rotation'])
-            )
+        for i, bit in enumerate(binary_data.tolist()):
+            # Choose vertex from the bit, offset by position
+            vx, vy = vertex_rows[(bit + i) % 3]
 
-            encoded_points.append(rotated_point)
-            current_point = new_point
+            # Move towards the chosen vertex and apply rotation
+            x = (x + vx) * scale
+            y = (y + vy) * scale
+            encoded_points[i] = (x * cos_r - y * sin_r, x * sin_r + y * cos_r)
 
         return encoded_points
 
-    def _dragon_encode(self, binary_data: str, params: Dict[str, Any]) -> List[Tuple]:
+    def _dragon_encode(self, binary_data: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
         """Encode data using Dragon curve"""
-        encoded_points = []
-
         # Generate dragon curve sequence
-        dragon_sequence = self._generate_dragon_sequence(len(binary_data))
+        dragon_sequence = self._generate_dragon_sequence(binary_data.size)
 
-        # Map binary data to dragon curve
-        current_pos = (0, 0)
-        current_angle = 0
+        # Each bit turns left or right, flipped by the dragon sequence
+        turns = np.where(binary_data, 1, -1) * dragon_sequence
 
-        for i, bit in enumerate(binary_data):
-            # Determine turn direction
-            turn = 1 if bit == '1' else -1
-            if i < len(dragon_sequence):
-                turn *= dragon_sequence[i]
+        # The heading and position are running sums of the turns and steps
+        angles = np.cumsum(turns * params['angle'])
+        steps_x = params['scale'] * np.cos(angles)
+        steps_y = params['scale'] * np.sin(angles)
 
-            # Update angle
-            current_angle += turn * params['angle']
+        return np.column_stack((np.cumsum(steps_x), np.cumsum(steps_y)))
 
-            # Move forward
-            new_pos = (
-                current_pos[0] + params['scale'] * np.cos(current_angle),
-                current_pos[1] + params['scale'] * np.sin(current_angle)
-            )
-
-            encoded_points.append(new_pos)
-            current_pos = new_pos
-
-        return encoded_points
-
-    def _lorenz_encode(self, binary_data: str, params: Dict[str, Any]) -> List[Tuple]:
+    def _lorenz_encode(self, binary_data: np.ndarray, params: Dict[str, Any]) -> np.ndarray:
         """Encode data using Lorenz attractor"""
+        if NUMBA_AVAILABLE:
+            return _lorenz_kernel(binary_data, float(params['sigma']), float(params['rho']),
+                                  float(params['beta']), float(params['dt']))
+
         encoded_points = []
 
         # Initial conditions
         x, y, z = 1.0, 1.0, 1.0
 
-        for bit in binary_data:
+        for bit in binary_data.tolist():
             # Lorenz equations
             dx = params['sigma'] * (y - x)
             dy = x * (params['rho'] - z) - y
@@ -269,105 +461,90 @@ class FractalEncoder(BaseEncoder):
             z += dz * params['dt']
 
             # Perturb based on bit value
-            if bit == '1':
+            if bit:
                 x += 0.1
                 y += 0.1
 
             encoded_points.append((x, y, z))
 
-        return encoded_points
+        return np.array(encoded_points, dtype=np.float64).reshape(-1, 3)
 
-    def _generate_dragon_sequence(self, length: int) -> List[int]:
+    def _generate_dragon_sequence(self, length: int) -> np.ndarray:
         """Generate dragon curve turn sequence"""
-        sequence = [1]
+        sequence = np.ones(1, dtype=np.int8)
 
-        while len(sequence) < length:
+        while sequence.size < length:
             # Dragon curve generation rule
-            new_sequence = sequence + [1] + [-x for x in reversed(sequence)]
-            sequence = new_sequence
+            sequence = np.concatenate((sequence, np.ones(1, dtype=np.int8), -sequence[::-1]))
 
         return sequence[:length]
 
-    def _apply_chaos_mapping(self, fractal_data: List) -> str:
-        """Apply chaotic mapping for additional obfuscation"""
-        # Convert fractal data to string representation
-        data_str = json.dumps(fractal_data, default=str)
-
-        # Apply logistic map chaos
-        x = 0.5  # Initial condition
-        r = 3.9  # Chaos parameter
-
-        chaotic_sequence = []
-        for char in data_str:
-            x = r * x * (1 - x)  # Logistic map
-            chaotic_value = int((x * 256)) % 256
-            encrypted_char = chr(ord(char) ^ chaotic_value)
-            chaotic_sequence.append(encrypted_char)
+    def _pack_fractal_data(self, fractal_data: Any) -> bytes:
+        """Serialize fractal output as raw arrays in an .npz buffer"""
+        if isinstance(fractal_data, dict):
+            arrays = fractal_data
+        else:
+            arrays = {'points': np.asarray(fractal_data, dtype=np.float64)}
 
-        return ''.join(chaotic_sequence)
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+        return buffer.getvalue()
 
-    def _reverse_chaos_mapping(self, chaos_data: str) -> List:
-        """Reverse the chaotic mapping"""
-        x = 0.5  # Same initial condition
-        r = 3.9  # Same chaos parameter
-
-        decrypted_sequence = []
-        for char in chaos_data:
-            x = r * x * (1 - x)
-            chaotic_value = int((x * 256)) % 256
-            decrypted_char = chr(ord(char) ^ chaotic_value)
-            decrypted_sequence.append(decrypted_char)
+    def _unpack_fractal_data(self, payload: bytes) -> Dict[str, np.ndarray]:
+        """Load the arrays written by _pack_fractal_data"""
+        with np.load(io.BytesIO(payload), allow_pickle=False) as arrays:
+            return {name: arrays[name] for name in arrays.files}
 
-        data_str = ''.join(decrypted_sequence)
-        return json.loads(data_str)
+    def _apply_chaos_mapping(self, data: bytes) -> bytes:
+        """Apply (or, applied again, remove) chaotic mapping for additional obfuscation"""
+        # Logistic map chaos: initial condition 0.5, chaos parameter 3.9
+        return _chaos_xor(data, 0.5, 3.9)
 
     def _create_coordinate_system(self, data_length: int) -> Dict[str, Any]:
         """Create fractal coordinate system for mapping"""
+        origin_x, origin_y, scale_x, scale_y, rotation = self._rng.uniform(
+            (-1, -1, 0.5, 0.5, 0), (1, 1, 2.0, 2.0, 2 * np.pi)).tolist()
         return {
-            'origin': (np.random.uniform(-1, 1), np.random.uniform(-1, 1)),
-            'scale_x': np.random.uniform(0.5, 2.0),
-            'scale_y': np.random.uniform(0.5, 2.0),
-            'rotation': np.random.uniform(0, 2 * np.pi),
+            'origin': (origin_x, origin_y),
+            'scale_x': scale_x,
+            'scale_y': scale_y,
+            'rotation': rotation,
             'data_length': data_length
         }
 
-    def _fractal_decode(self, fractal_data: List, fractal_type: str, params: Dict[str, Any]) -> str:
-        """Decode fractal data back to binary"""
+    def _fractal_decode(self, fractal_data: Any, fractal_type: str, params: Dict[str, Any]) -> np.ndarray:
+        """Decode fractal data back to a 0/1 bit array"""
         # This is a simplified decoding process
         # In practice, this would involve complex reverse mapping
 
+        if isinstance(fractal_data, dict):
+            if fractal_type in ('mandelbrot', 'julia'):
+                # Column layout: one bit per iteration count
+                return (fractal_data['iterations'] % 2).astype(np.uint8)
+
+            # Geometric fractals: compare the first two coordinates of each point
+            points = fractal_data['points']
+            if points.size == 0:
+                return np.zeros(0, dtype=np.uint8)
+            return (points[:, 0] > points[:, 1]).astype(np.uint8)
+
         binary_bits = []
 
         for point_data in fractal_data:
             # Extract bit based on fractal properties
             if fractal_type == 'mandelbrot':
-                bit = '1' if point_data['iterations'] % 2 == 1 else '0'
+                bit = point_data['iterations'] % 2
             elif fractal_type == 'julia':
-                bit = '1' if point_data['iterations'] % 2 == 1 else '0'
+                bit = point_data['iterations'] % 2
             elif fractal_type in ['sierpinski', 'dragon', 'lorenz']:
                 # For geometric fractals, use position-based decoding
                 if isinstance(point_data, (list, tuple)) and len(point_data) >= 2:
-                    bit = '1' if point_data[0] > point_data[1] else '0'
+                    bit = 1 if point_data[0] > point_data[1] else 0
                 else:
-                    bit = '0'
+                    bit = 0
             else:
-                bit = '0'
+                bit = 0
 
             binary_bits.append(bit)
 
-        return ''.join(binary_bits)
-
-    def _binary_to_string(self, binary_data: str, original_length: int) -> str:
-        """Convert binary data back to string"""
-        # Ensure binary data is multiple of 8
-        while len(binary_data) % 8 != 0:
-            binary_data += '0'
-
-        chars = []
-        for i in range(0, len(binary_data), 8):
-            byte = binary_data[i:i+8]
-            if len(byte) == 8:
-                chars.append(chr(int(byte, 2)))
-
-        result = ''.join(chars)
-        return result[:original_length]
+        return np.array(binary_bits, dtype=np.uint8)
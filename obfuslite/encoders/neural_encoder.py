@@ -29,7 +29,7 @@ class NeuralEncoder(BaseEncoder):
         Encode string data as neural network weights
         """
         # Convert to binary
-        binary_data = ''.join(format(ord(char), '08b') for char in data)
+        binary_data = self._to_binary_string(data)
         
         # Convert binary to numerical array
         data_array = np.array([float(bit) for bit in binary_data])
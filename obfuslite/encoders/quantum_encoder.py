@@ -6,9 +6,16 @@ Uses quantum gate operations and superposition concepts for encoding
 import numpy as np
 import base64
 import json
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional
 from .base import BaseEncoder
 
+# Gate and state precision; every gate entry is exactly representable in
+# single precision and decoding only compares state magnitudes
+STATE_DTYPE = np.complex64
+
+# Measurement bases, indexed by the int8 codes stored in the metadata
+MEASUREMENT_BASES = ('computational', 'hadamard', 'circular')
+
 class QuantumEncoder(BaseEncoder):
     """
     Quantum-inspired encoder that uses quantum gate operations
@@ -26,12 +33,18 @@ class QuantumEncoder(BaseEncoder):
             'T': np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]])  # T gate
         }
 
+        # All gates stacked as one (num_gates, 2, 2) array for batched application
+        self._gate_matrices = np.stack([gate.astype(STATE_DTYPE) for gate in self.gates.values()])
+
+        # Per-instance generator for all random draws
+        self._rng = np.random.default_rng()
+
     def encode(self, data: str) -> Dict[str, Any]:
         """
         Encode string data using quantum-inspired transformations
         """
-        # Convert string to binary
-        binary_data = ''.join(format(ord(char), '08b') for char in data)
+        # Convert string to a 0/1 bit array
+        binary_data = np.unpackbits(np.frombuffer(data.encode('utf-8'), dtype=np.uint8))
 
         # Create quantum circuit representation
         circuit = self._create_quantum_circuit(binary_data)
@@ -54,6 +67,7 @@ class QuantumEncoder(BaseEncoder):
                 'circuit_length': len(circuit),
                 'entanglement_map': entanglement_map,
                 'measurement_basis': measurement_basis,
+                'state_dtype': np.dtype(STATE_DTYPE).name,
                 'original_length': len(data)
             }
         }
@@ -63,7 +77,7 @@ class QuantumEncoder(BaseEncoder):
         Decode quantum-encoded data back to original string
         """
         # Reconstruct quantum states
-        quantum_states = self._decode_quantum_states(encoded_data)
+        quantum_states = self._decode_quantum_states(encoded_data, metadata.get('state_dtype'))
 
         # Apply inverse quantum operations
         circuit = self._reconstruct_circuit(quantum_states, metadata)
@@ -72,79 +86,67 @@ class QuantumEncoder(BaseEncoder):
         binary_data = self._circuit_to_binary(circuit, metadata)
 
         # Convert binary to string
-        original_data = self._binary_to_string(binary_data, metadata['original_length'])
+        original_data = self._bits_to_string(binary_data, metadata['original_length'])
 
         return original_data
 
-    def _create_quantum_circuit(self, binary_data: str) -> List[Dict]:
+    def _create_quantum_circuit(self, binary_data: np.ndarray) -> List[Dict]:
         """Create a quantum circuit representation from binary data"""
         circuit = []
 
         # Group binary data into qubits (2 bits per qubit for superposition)
-        for i in range(0, len(binary_data), 2):
-            qubit_bits = binary_data[i:i+2].ljust(2, '0')
+        if binary_data.size % 2:
+            binary_data = np.append(binary_data, 0)
+        qubit_codes = (binary_data[0::2] * 2 + binary_data[1::2]).tolist()
 
+        for code in qubit_codes:
             # Map binary to quantum state
-            if qubit_bits == '00':
+            if code == 0b00:
                 state = [1, 0]  # |0⟩
-            elif qubit_bits == '01':
+            elif code == 0b01:
                 state = [0, 1]  # |1⟩
-            elif qubit_bits == '10':
+            elif code == 0b10:
                 state = [1/np.sqrt(2), 1/np.sqrt(2)]  # |+⟩
-            else:  # '11'
+            else:  # 0b11
                 state = [1/np.sqrt(2), -1/np.sqrt(2)]  # |-⟩
 
             circuit.append({
-                'state': np.array(state, dtype=complex),
-                'gates_applied': []
+                'state': np.array(state, dtype=STATE_DTYPE)
             })
 
         return circuit
 
-    def _apply_quantum_gates(self, circuit: List[Dict]) -> List[np.ndarray]:
-        """Apply random quantum gates to the circuit"""
-        gate_names = list(self.gates.keys())
-        quantum_states = []
-
-        for qubit in circuit:
-            state = qubit['state'].copy()
+    def _apply_quantum_gates(self, circuit: List[Dict]) -> np.ndarray:
+        """Apply random quantum gates to the circuit
 
-            # Apply 2-4 random gates
-            num_gates = np.random.randint(2, 5)
-            gates_applied = []
+        Gates are applied to every qubit at once, one gate slot at a time.
+        """
+        states = np.array([qubit['state'] for qubit in circuit], dtype=STATE_DTYPE).reshape(-1, 2)
+        num_qubits = len(states)
 
-            for _ in range(num_gates):
-                gate_name = np.random.choice(gate_names)
-                gate = self.gates[gate_name]
-                state = gate @ state
-                gates_applied.append(gate_name)
+        # Apply 2-4 random gates per qubit
+        num_gates = self._rng.integers(2, 5, size=num_qubits)
+        gate_ids = self._rng.integers(0, len(self._gate_matrices), size=(num_qubits, 4))
 
-            qubit['gates_applied'] = gates_applied
-            quantum_states.append(state)
+        for slot in range(4):
+            applied = np.einsum('nij,nj->ni', self._gate_matrices[gate_ids[:, slot]], states)
+            states = np.where((slot < num_gates)[:, None], applied, states)
 
-        return quantum_states
+        return states
 
     def _encode_quantum_states(self, quantum_states: List[np.ndarray]) -> str:
-        """Encode quantum states as base64 string"""
-        # Convert complex arrays to serializable format
-        serializable_states = []
-        for state in quantum_states:
-            serializable_states.append({
-                'real': state.real.tolist(),
-                'imag': state.imag.tolist()
-            })
-
-        # Serialize and encode
-        json_data = json.dumps(serializable_states)
-        encoded = base64.b64encode(json_data.encode()).decode()
-
-        return encoded
+        """Encode quantum states as base64 of their raw complex values"""
+        states = np.array(quantum_states, dtype=STATE_DTYPE).reshape(-1, 2)
+        return base64.b64encode(states.tobytes()).decode()
 
-    def _decode_quantum_states(self, encoded_data: str) -> List[np.ndarray]:
+    def _decode_quantum_states(self, encoded_data: str, state_dtype: Optional[str] = None) -> List[np.ndarray]:
         """Decode quantum states from base64 string"""
-        # Decode and deserialize
-        json_data = base64.b64decode(encoded_data.encode()).decode()
-        serializable_states = json.loads(json_data)
+        raw = base64.b64decode(encoded_data.encode())
+        if state_dtype is not None:
+            return np.frombuffer(raw, dtype=state_dtype).reshape(-1, 2)
+
+        # Older payloads stored the states as JSON lists
+        serializable_states = json.loads(raw.decode())
 
         # Reconstruct complex arrays
         quantum_states = []
@@ -156,21 +158,22 @@ class QuantumEncoder(BaseEncoder):
 
         return quantum_states
 
-    def _generate_entanglement_map(self, length: int) -> List[Tuple[int, int]]:
-        """Generate entanglement pairs for additional security"""
-        entanglement_map = []
-        indices = list(range(length // 2))
-        np.random.shuffle(indices)
+    def _generate_entanglement_map(self, length: int) -> str:
+        """Generate entanglement pairs for additional security
 
-        for i in range(0, len(indices) - 1, 2):
-            entanglement_map.append((indices[i], indices[i + 1]))
+        Returns base64 of an (N, 2) int32 array of paired qubit indices.
+        """
+        indices = self._rng.permutation(length // 2)
+        pairs = indices[:indices.size // 2 * 2].reshape(-1, 2).astype(np.int32)
+        return base64.b64encode(pairs.tobytes()).decode()
 
-        return entanglement_map
+    def _generate_measurement_basis(self, num_qubits: int) -> str:
+        """Generate random measurement basis for each qubit
 
-    def _generate_measurement_basis(self, num_qubits: int) -> List[str]:
-        """Generate random measurement basis for each qubit"""
-        bases = ['computational', 'hadamard', 'circular']
-        return [np.random.choice(bases) for _ in range(num_qubits)]
+        Returns base64 of one int8 index into MEASUREMENT_BASES per qubit.
+        """
+        codes = self._rng.integers(0, len(MEASUREMENT_BASES), size=num_qubits, dtype=np.int8)
+        return base64.b64encode(codes.tobytes()).decode()
 
     def _reconstruct_circuit(self, quantum_states: List[np.ndarray],
                            metadata: Dict[str, Any]) -> List[Dict]:
@@ -201,39 +204,20 @@ class QuantumEncoder(BaseEncoder):
         else:
             return np.array([0, 1], dtype=complex)
 
-    def _circuit_to_binary(self, circuit: List[Dict], metadata: Dict[str, Any]) -> str:
-        """Convert quantum circuit back to binary representation"""
-        binary_data = ""
-
-        for qubit in circuit:
-            state = qubit['state']
-
-            # Determine binary representation based on state
-            if np.allclose(state, [1, 0]):
-                binary_data += "00"
-            elif np.allclose(state, [0, 1]):
-                binary_data += "01"
-            elif np.allclose(state, [1/np.sqrt(2), 1/np.sqrt(2)], atol=1e-10):
-                binary_data += "10"
-            else:
-                binary_data += "11"
-
-        return binary_data
-
-    def _binary_to_string(self, binary_data: str, original_length: int) -> str:
-        """Convert binary data back to string"""
-        # Pad binary data to multiple of 8
-        while len(binary_data) % 8 != 0:
-            binary_data += "0"
-
-        # Convert to characters
-        chars = []
-        for i in range(0, len(binary_data), 8):
-            byte = binary_data[i:i+8]
-            if len(byte) == 8:
-                chars.append(chr(int(byte, 2)))
-
-        result = ''.join(chars)
-
-        # Trim to original length
-        return result[:original_length]
+    def _circuit_to_binary(self, circuit: List[Dict], metadata: Dict[str, Any]) -> np.ndarray:
+        """Convert quantum circuit back to a 0/1 bit array"""
+        states = np.array([qubit['state'] for qubit in circuit], dtype=np.complex128).reshape(-1, 2)
+
+        def close_to(target, atol=1e-8):
+            # Row-wise np.allclose with its default relative tolerance
+            target = np.asarray(target)
+            return np.all(np.abs(states - target) <= atol + 1e-5 * np.abs(target), axis=1)
+
+        # Determine binary representation based on state:
+        # |0> -> 00, |1> -> 01, |+> -> 10, anything else -> 11
+        is_zero = close_to([1, 0])
+        is_one = ~is_zero & close_to([0, 1])
+        high = ~(is_zero | is_one)
+        low = is_one | (high & ~close_to([1/np.sqrt(2), 1/np.sqrt(2)], atol=1e-10))
+
+        return np.column_stack((high, low)).ravel().astype(np.uint8)
@@ -9,6 +9,12 @@ import random
 from typing import Dict, Any
 from .base import BaseEncoder
 
+
+def _xor_table(key: int) -> bytes:
+    """Build a bytes.translate table that XORs every byte with key"""
+    return bytes(b ^ key for b in range(256))
+
+
 class SimpleEncoder(BaseEncoder):
     """
     Simple XOR-based encoder for testing purposes
@@ -24,7 +30,7 @@ class SimpleEncoder(BaseEncoder):
 
         # Convert string to bytes and XOR with key
         data_bytes = data.encode('utf-8')
-        encoded_bytes = bytes([b ^ key for b in data_bytes])
+        encoded_bytes = data_bytes.translate(_xor_table(key))
 
         # Encode as base64 for safe storage
         encoded_b64 = base64.b64encode(encoded_bytes).decode('ascii')
@@ -48,7 +54,7 @@ class SimpleEncoder(BaseEncoder):
         encoded_bytes = base64.b64decode(encoded_data.encode('ascii'))
 
         # XOR with key to get original bytes
-        original_bytes = bytes([b ^ key for b in encoded_bytes])
+        original_bytes = encoded_bytes.translate(_xor_table(key))
 
         # Convert back to string
         original_data = original_bytes.decode('utf-8')
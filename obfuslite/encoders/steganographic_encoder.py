@@ -8,8 +8,62 @@ import string
 import base64
 import json
 import math
+from itertools import accumulate
 from typing import Dict, Any, List, Tuple
-from obfuscator_core import BaseEncoder
+from .base import BaseEncoder
+
+# Optional faster JSON codec for the outer payload
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional array backend for the LSB passes over larger payloads
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Payload size in bytes from which the LSB passes switch to NumPy; below it
+# the array set-up costs more than the pure bytes/int path
+NUMPY_MIN_BYTES = 64
+
+# Byte value with its least significant bit cleared, for bytes.translate
+_LSB_CLEAR = bytes(b & 0xFE for b in range(256))
+
+# ASCII '0'/'1' digits to the bit values 0/1
+_DIGIT_BITS = bytes.maketrans(b'01', b'\x00\x01')
+
+# Byte value to the ASCII digit of its least significant bit
+_LSB_DIGITS = bytes(0x30 | (b & 1) for b in range(256))
+
+# Decimal digit to '1' for a 9 and '0' otherwise
+_NINE_BITS = str.maketrans('0123456789', '0000000001')
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize obj as compact UTF-8 JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _decimal_parts(value: float) -> Tuple[str, int, int]:
+    """Split value's 15-decimal form into its integer part, its decimal
+    places as an int, and a bit mask (most significant place first) of
+    the places holding a 9"""
+    integer_part, digits = f"{value:.15f}".split('.')
+    return integer_part, int(digits), int(digits.translate(_NINE_BITS), 2)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class SteganographicEncoder(BaseEncoder):
     """
@@ -17,6 +71,49 @@ class SteganographicEncoder(BaseEncoder):
     such as fake configuration files, lorem ipsum text, or mathematical constants
     """
     
+    # Constants used by the math_constants cover, with their 15-decimal
+    # (integer part, decimal places, nines mask) split
+    _SQRT5 = math.sqrt(5)
+    _SQRT2 = math.sqrt(2)
+    _SQRT3 = math.sqrt(3)
+    _BASE_CONSTANTS = {
+        'pi': math.pi,
+        'e': math.e,
+        'golden_ratio': (1 + _SQRT5) / 2,
+        'sqrt_2': _SQRT2,
+        'sqrt_3': _SQRT3
+    }
+    _CONSTANT_PARTS = {name: _decimal_parts(value) for name, value in _BASE_CONSTANTS.items()}
+    
+    # Word pools for the poetry cover by syllable count; a one-syllable word
+    # is picked twice as often as a two- or three-syllable one
+    _POETRY_POOLS = {
+        1: ('cat', 'dog', 'sun', 'moon', 'tree', 'sea', 'sky', 'bird'),
+        2: ('happy', 'garden', 'mountain', 'river', 'flower', 'dancing'),
+        3: ('beautiful', 'wonderful', 'amazing', 'fantastic')
+    }
+    _POETRY_SYLLABLES = {word: syllables
+                         for syllables, pool in _POETRY_POOLS.items() for word in pool}
+    _POETRY_WORDS = tuple(_POETRY_SYLLABLES)
+    _POETRY_CUM_WEIGHTS = tuple(accumulate((2 if syllables == 1 else 1) / len(pool)
+                                           for syllables, pool in _POETRY_POOLS.items()
+                                           for _ in pool))
+    
+    # Upper bound on the serialized length of one fake data record plus its
+    # separator (for ids below 10**9)
+    _FAKE_RECORD_SPAN = 96
+    
+    # Static part of the decoy metadata; the checksum is drawn per payload
+    _DECOY_TEMPLATE = {
+        'created': '2024-01-01T00:00:00Z',
+        'author': 'System Generator',
+        'checksum': None,
+        'compression': 'none',
+        'encoding': 'utf-8'
+    }
+    
+    __slots__ = ('cover_types', 'lorem_words', '_lorem_span')
+    
     def __init__(self):
         self.cover_types = {
             'lorem_ipsum': self._lorem_ipsum_cover,
@@ -38,38 +135,43 @@ class SteganographicEncoder(BaseEncoder):
             'deserunt', 'mollit', 'anim', 'id', 'est', 'laborum'
         ]
         
+        # Most characters one Lorem word can add, counting its separator
+        self._lorem_span = max(len(word) for word in self.lorem_words) + 1
+        
     def encode(self, data: str) -> Dict[str, Any]:
         """
         Encode string data using steganographic techniques
         """
-        # Convert to binary
-        binary_data = ''.join(format(ord(char), '08b') for char in data)
+        # Work on the UTF-8 bytes of the text
+        raw = data.encode('utf-8')
         
         # Choose random cover type
         cover_type = random.choice(list(self.cover_types.keys()))
         
-        # Generate cover data
-        cover_data = self.cover_types[cover_type](binary_data)
+        # Generate cover data; the payload is carried by the LSB layer alone,
+        # so the cover only has to be long enough to hold one bit per character
+        cover_data = self.cover_types[cover_type](len(raw) * 8)
         
         # Apply additional steganographic layers
-        layered_data = self._apply_steganographic_layers(cover_data, binary_data)
+        layered_data = self._apply_steganographic_layers(cover_data, raw)
         
         # Create decoy metadata
         decoy_metadata = self._generate_decoy_metadata(cover_type)
         
         # Encode as base64
-        encoded_data = base64.b64encode(json.dumps({
+        encoded_data = base64.b64encode(_json_dumps({
             'cover_data': layered_data,
             'decoy_metadata': decoy_metadata
-        }).encode()).decode()
+        })).decode('ascii')
         
         return {
             'encoded': encoded_data,
             'metadata': {
                 'cover_type': cover_type,
                 'original_length': len(data),
-                'binary_length': len(binary_data),
-                'steganographic_method': 'multi_layer'
+                'binary_length': len(raw) * 8,
+                'steganographic_method': 'multi_layer',
+                'text_encoding': 'utf-8'
             }
         }
         
@@ -78,7 +180,7 @@ class SteganographicEncoder(BaseEncoder):
         Decode steganographically hidden data
         """
         # Decode from base64
-        stego_data = json.loads(base64.b64decode(encoded_data.encode()).decode())
+        stego_data = _json_loads(base64.b64decode(encoded_data))
         
         # Extract cover data
         cover_data = stego_data['cover_data']
@@ -88,218 +190,141 @@ class SteganographicEncoder(BaseEncoder):
         binary_data = self._extract_from_steganographic_layers(cover_data, cover_type)
         
         # Convert binary to string
-        original_data = self._binary_to_string(binary_data, metadata['original_length'])
+        original_data = self._binary_to_string(binary_data, metadata['original_length'],
+                                               metadata.get('text_encoding', 'latin-1'))
         
         return original_data
         
-    def _lorem_ipsum_cover(self, binary_data: str) -> str:
-        """Hide data in Lorem Ipsum text using word selection"""
+    def _lorem_ipsum_cover(self, min_length: int) -> str:
+        """Generate Lorem Ipsum text of at least min_length characters"""
         cover_text = []
-        bit_index = 0
-        
-        # Generate enough text to hide all data
-        while bit_index < len(binary_data):
-            # Select word based on bit value
-            if bit_index < len(binary_data):
-                bit = binary_data[bit_index]
-                if bit == '1':
-                    # Choose word with odd length
-                    word_candidates = [w for w in self.lorem_words if len(w) % 2 == 1]
-                else:
-                    # Choose word with even length
-                    word_candidates = [w for w in self.lorem_words if len(w) % 2 == 0]
-                    
-                if word_candidates:
-                    word = random.choice(word_candidates)
-                else:
-                    word = random.choice(self.lorem_words)
-                    
-                cover_text.append(word)
-                bit_index += 1
-                
-            # Add some random words for naturalness
-            if random.random() < 0.3:
-                cover_text.append(random.choice(self.lorem_words))
-                
+        length = 0
+        
+        # Draw words in batches that cannot overshoot the remaining length by
+        # more than one word; each word takes its length plus a space (or the
+        # final period)
+        while length < min_length:
+            batch = random.choices(self.lorem_words, k=(min_length - length) // self._lorem_span + 1)
+            cover_text += batch
+            length += sum(map(len, batch)) + len(batch)
+            
         return ' '.join(cover_text) + '.'
         
-    def _config_file_cover(self, binary_data: str) -> Dict[str, Any]:
-        """Hide data in fake configuration file"""
+    def _config_file_cover(self, min_length: int) -> Dict[str, Any]:
+        """Generate a fake configuration file of at least min_length characters as JSON"""
+        bool_keys = ['debug', 'enabled', 'auto_update', 'logging', 'compression']
         config = {
-            'version': '1.0.0',
+            'version': '.'.join(str(random.randint(0, 7)) for _ in range(3)),
             'debug': False,
-            'settings': {},
+            'settings': {key: random.random() < 0.5 for key in bool_keys},
             'features': [],
-            'metadata': {}
+            'metadata': {'param_0': random.randint(0, 255)}
         }
         
-        # Hide data in various config values
-        bit_index = 0
-        
-        # Hide in version numbers
-        version_parts = []
-        for i in range(3):
-            if bit_index + 3 < len(binary_data):
-                bits = binary_data[bit_index:bit_index + 3]
-                version_parts.append(str(int(bits, 2)))
-                bit_index += 3
-            else:
-                version_parts.append(str(random.randint(0, 7)))
-                
-        config['version'] = '.'.join(version_parts)
-        
-        # Hide in boolean values
-        bool_keys = ['debug', 'enabled', 'auto_update', 'logging', 'compression']
-        for key in bool_keys:
-            if bit_index < len(binary_data):
-                config['settings'][key] = binary_data[bit_index] == '1'
-                bit_index += 1
-                
-        # Hide in array lengths
-        while bit_index + 4 < len(binary_data):
-            bits = binary_data[bit_index:bit_index + 4]
-            array_length = int(bits, 2)
+        # Pad with feature lists; each entry adds at least its quoted name
+        length = len(json.dumps(config, sort_keys=True))
+        while length < min_length:
             feature_name = f"feature_{len(config['features'])}"
+            array_length = random.randint(0, 15)
             config['features'].extend([feature_name] * array_length)
-            bit_index += 4
+            length += array_length * (len(feature_name) + 2)
             
-        # Hide remaining bits in metadata
-        while bit_index < len(binary_data):
-            key = f"param_{len(config['metadata'])}"
-            if bit_index + 8 < len(binary_data):
-                bits = binary_data[bit_index:bit_index + 8]
-                config['metadata'][key] = int(bits, 2)
-                bit_index += 8
-            else:
-                remaining_bits = binary_data[bit_index:]
-                config['metadata'][key] = int(remaining_bits.ljust(8, '0'), 2)
-                break
-                
         return config
         
-    def _math_constants_cover(self, binary_data: str) -> Dict[str, float]:
-        """Hide data in mathematical constants"""
-        constants = {
-            'pi': math.pi,
-            'e': math.e,
-            'golden_ratio': (1 + math.sqrt(5)) / 2,
-            'sqrt_2': math.sqrt(2),
-            'sqrt_3': math.sqrt(3)
-        }
-        
-        # Modify constants to encode data
-        bit_index = 0
-        
-        for name, value in constants.items():
-            if bit_index >= len(binary_data):
-                break
+    def _math_constants_cover(self, min_length: int) -> Dict[str, float]:
+        """Generate slightly perturbed mathematical constants
+
+        Further rounds of numbered constants ('pi_1', 'e_1', ...) are added
+        until the serialized cover is at least min_length characters.
+        """
+        constants = {}
+        length = 0
+        round_index = 0
+        
+        while not constants or length < min_length:
+            for name, (integer_part, decimal_places, nines) in self._CONSTANT_PARTS.items():
+                # Bump a random subset of the 15 decimal places by one (mod 10):
+                # read the subset's bit mask as a decimal number of 0/1 digits and
+                # add it, then cancel the carry out of every bumped 9
+                bumped = random.getrandbits(15)
+                decimal_places += int(f"{bumped:b}") - 10 * int(f"{bumped & nines:b}")
                 
-            # Convert to string and modify decimal places
-            value_str = f"{value:.15f}"
-            decimal_part = value_str.split('.')[1]
-            
-            # Modify digits based on binary data
-            modified_digits = []
-            for i, digit in enumerate(decimal_part):
-                if bit_index < len(binary_data):
-                    bit = binary_data[bit_index]
-                    # Modify digit based on bit
-                    if bit == '1':
-                        new_digit = str((int(digit) + 1) % 10)
-                    else:
-                        new_digit = digit
-                    modified_digits.append(new_digit)
-                    bit_index += 1
-                else:
-                    modified_digits.append(digit)
-                    
-            # Reconstruct number
-            integer_part = value_str.split('.')[0]
-            constants[name] = float(f"{integer_part}.{''.join(modified_digits)}")
+                # Reconstruct number
+                key = f"{name}_{round_index}" if round_index else name
+                value = float(f"{integer_part}.{decimal_places:015d}")
+                constants[key] = value
+                
+                # '"key": value, ' in the serialized dict
+                length += len(key) + len(repr(value)) + 6
+            round_index += 1
             
         return constants
         
-    def _fake_data_cover(self, binary_data: str) -> List[Dict[str, Any]]:
-        """Hide data in fake database records"""
+    def _fake_data_cover(self, min_length: int) -> List[Dict[str, Any]]:
+        """Generate fake database records of at least min_length characters as JSON"""
         records = []
-        bit_index = 0
+        length = 0
         
         names = ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve', 'Frank', 'Grace', 'Henry']
         cities = ['New York', 'London', 'Tokyo', 'Paris', 'Berlin', 'Sydney', 'Toronto']
         
-        while bit_index < len(binary_data):
-            record = {
-                'id': len(records) + 1,
-                'name': random.choice(names),
-                'city': random.choice(cities),
-                'active': True,
-                'score': 0.0
-            }
+        # Draw whole batches of records, sized so a batch cannot overshoot the
+        # remaining length by more than one record
+        while length < min_length:
+            count = (min_length - length) // self._FAKE_RECORD_SPAN + 1
+            first_id = len(records) + 1
+            batch = [
+                {
+                    'id': record_id,
+                    'name': name,
+                    'city': city,
+                    'active': active,
+                    'score': score / 100.0
+                }
+                for record_id, name, city, active, score in zip(
+                    range(first_id, first_id + count),
+                    random.choices(names, k=count),
+                    random.choices(cities, k=count),
+                    random.choices((True, False), k=count),
+                    random.choices(range(128), k=count))
+            ]
+            records += batch
+            # A serialized list is its records plus 2 characters each for
+            # the ', ' separators and the brackets
+            length += len(json.dumps(batch))
             
-            # Hide data in various fields
-            if bit_index < len(binary_data):
-                record['active'] = binary_data[bit_index] == '1'
-                bit_index += 1
-                
-            if bit_index + 7 < len(binary_data):
-                bits = binary_data[bit_index:bit_index + 7]
-                record['score'] = int(bits, 2) / 100.0
-                bit_index += 7
-                
-            records.append(record)
-            
-            # Limit number of records
-            if len(records) >= 20:
-                break
-                
         return records
         
-    def _poetry_cover(self, binary_data: str) -> List[str]:
-        """Hide data in poetry structure"""
+    def _poetry_cover(self, min_length: int) -> List[str]:
+        """Generate poem lines of at least min_length characters as JSON"""
         poem_lines = []
-        bit_index = 0
-        
-        # Word pools for different syllable counts
-        one_syllable = ['cat', 'dog', 'sun', 'moon', 'tree', 'sea', 'sky', 'bird']
-        two_syllable = ['happy', 'garden', 'mountain', 'river', 'flower', 'dancing']
-        three_syllable = ['beautiful', 'wonderful', 'amazing', 'fantastic']
+        length = 0
         
-        while bit_index < len(binary_data) and len(poem_lines) < 10:
+        while length < min_length:
             line_words = []
-            line_bits = 0
             
             # Create line with 8-12 syllables
             target_syllables = random.randint(8, 12)
             current_syllables = 0
             
-            while current_syllables < target_syllables and bit_index < len(binary_data):
-                if bit_index + 1 < len(binary_data):
-                    bits = binary_data[bit_index:bit_index + 2]
-                    bit_index += 2
-                    
-                    # Choose word based on bits
-                    if bits == '00':
-                        word = random.choice(one_syllable)
-                        syllables = 1
-                    elif bits == '01':
-                        word = random.choice(two_syllable)
-                        syllables = 2
-                    elif bits == '10':
-                        word = random.choice(three_syllable)
-                        syllables = 3
-                    else:
-                        word = random.choice(one_syllable)
-                        syllables = 1
-                        
+            while current_syllables < target_syllables:
+                # Draw enough words to finish the line if they were all one
+                # syllable; words that would overrun the line are skipped
+                for word in random.choices(self._POETRY_WORDS, cum_weights=self._POETRY_CUM_WEIGHTS,
+                                           k=target_syllables - current_syllables):
+                    syllables = self._POETRY_SYLLABLES[word]
                     if current_syllables + syllables <= target_syllables:
                         line_words.append(word)
                         current_syllables += syllables
                         
-            poem_lines.append(' '.join(line_words))
+            line = ' '.join(line_words)
+            poem_lines.append(line)
+            # Quotes plus the ', ' separator (or the brackets)
+            length += len(line) + 4
             
         return poem_lines
         
-    def _apply_steganographic_layers(self, cover_data: Any, binary_data: str) -> Any:
+    def _apply_steganographic_layers(self, cover_data: Any, raw: bytes) -> Any:
         """Apply additional steganographic layers"""
         # Convert cover data to string for processing
         if isinstance(cover_data, dict):
@@ -309,61 +334,54 @@ class SteganographicEncoder(BaseEncoder):
         else:
             cover_str = str(cover_data)
             
-        # Apply LSB steganography to character codes
-        modified_chars = []
-        bit_index = 0
+        # Apply LSB steganography to the character codes of the first
+        # len(raw) * 8 characters; covers are ASCII text
+        count = min(len(raw) * 8, len(cover_str))
+        if not count:
+            return cover_str
+        
+        cover_bytes = cover_str[:count].encode('latin-1')
+        if NUMPY_AVAILABLE and len(raw) >= NUMPY_MIN_BYTES:
+            merged = np.frombuffer(cover_bytes, dtype=np.uint8) & 0xFE
+            merged |= np.unpackbits(np.frombuffer(raw, dtype=np.uint8), count=count)
+            return merged.tobytes().decode('latin-1') + cover_str[count:]
+        
+        # Clear the LSBs, then OR in one payload bit per character
+        cleared = cover_bytes.translate(_LSB_CLEAR)
+        bits = format(int.from_bytes(raw, 'big'), f'0{len(raw) * 8}b')[:count]
+        bit_bytes = bits.encode('ascii').translate(_DIGIT_BITS)
+        merged = int.from_bytes(cleared, 'big') | int.from_bytes(bit_bytes, 'big')
+        
+        return merged.to_bytes(count, 'big').decode('latin-1') + cover_str[count:]
+        
+    def _extract_from_steganographic_layers(self, cover_data: str, cover_type: str) -> bytes:
+        """Extract data from steganographic layers
+
+        Returns the character code LSBs packed into bytes, most significant
+        bit first, with a trailing partial byte zero-padded.
+        """
+        cover_bytes = cover_data.encode('latin-1')
+        if NUMPY_AVAILABLE and len(cover_bytes) >= NUMPY_MIN_BYTES * 8:
+            return np.packbits(np.frombuffer(cover_bytes, dtype=np.uint8) & 1).tobytes()
         
-        for char in cover_str:
-            char_code = ord(char)
-            
-            # Modify LSB if we have data to hide
-            if bit_index < len(binary_data):
-                bit = int(binary_data[bit_index])
-                # Set LSB
-                char_code = (char_code & 0xFE) | bit
-                bit_index += 1
-                
-            modified_chars.append(chr(char_code))
-            
-        return ''.join(modified_chars)
+        # Map every character code to its LSB digit in one pass
+        digits = cover_bytes.translate(_LSB_DIGITS)
+        digits = digits.ljust(-(-len(digits) // 8) * 8, b'0')
         
-    def _extract_from_steganographic_layers(self, cover_data: str, cover_type: str) -> str:
-        """Extract data from steganographic layers"""
-        binary_bits = []
-        
-        # Extract LSBs from character codes
-        for char in cover_data:
-            char_code = ord(char)
-            lsb = char_code & 1
-            binary_bits.append(str(lsb))
-            
-        return ''.join(binary_bits)
+        # Parse all bits as one integer and write it out as bytes in one go
+        return int(digits, 2).to_bytes(len(digits) // 8, 'big') if digits else b''
         
     def _generate_decoy_metadata(self, cover_type: str) -> Dict[str, Any]:
         """Generate fake metadata to throw off analysis"""
-        return {
-            'format': cover_type,
-            'created': '2024-01-01T00:00:00Z',
-            'author': 'System Generator',
-            'checksum': random.randint(1000000, 9999999),
-            'compression': 'none',
-            'encoding': 'utf-8'
-        }
+        decoy_metadata = {'format': cover_type, **self._DECOY_TEMPLATE}
+        decoy_metadata['checksum'] = random.randint(1000000, 9999999)
+        return decoy_metadata
         
-    def _binary_to_string(self, binary_data: str, original_length: int) -> str:
-        """Convert binary data back to string"""
-        # Ensure binary data is multiple of 8
-        while len(binary_data) % 8 != 0:
-            binary_data += '0'
-            
-        chars = []
-        for i in range(0, len(binary_data), 8):
-            byte = binary_data[i:i+8]
-            if len(byte) == 8:
-                try:
-                    chars.append(chr(int(byte, 2)))
-                except ValueError:
-                    chars.append('\x00')
-                    
-        result = ''.join(chars)
-        return result[:original_length]
+    def _binary_to_string(self, binary_data: bytes, original_length: int,
+                          text_encoding: str = 'latin-1') -> str:
+        """Convert extracted bytes back to string
+
+        Older payloads stored one byte per character code ('latin-1');
+        current ones store the UTF-8 bytes of the text.
+        """
+        return binary_data.decode(text_encoding, errors='replace')[:original_length]
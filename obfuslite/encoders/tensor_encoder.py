@@ -5,9 +5,131 @@ Uses tensor operations and linear algebra for encoding
 
 import numpy as np
 import base64
+import io
 import json
 from typing import Dict, Any, List, Tuple
-from obfuscator_core import BaseEncoder
+from .base import BaseEncoder
+
+# Optional JIT compiler for the Haar wavelet kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit('float64[:](float64[:])', cache=True)
+    def _haar_forward_kernel(signal):
+        """Iterative Haar transform, padding odd levels with a zero"""
+        n = signal.size
+        if n <= 1:
+            return signal.copy()
+            
+        # One average plus the differences of every level
+        total = 1
+        m = n
+        while m > 1:
+            m = (m + 1) // 2
+            total += m
+            
+        out = np.empty(total)
+        work = signal.copy()
+        end = total
+        m = n
+        while m > 1:
+            half = (m + 1) // 2
+            for i in range(half):
+                a = work[2 * i]
+                b = work[2 * i + 1] if 2 * i + 1 < m else 0.0
+                out[end - half + i] = (a - b) / 2
+                work[i] = (a + b) / 2
+            end -= half
+            m = half
+            
+        out[0] = work[0]
+        return out
+        
+    @njit('float64[:](float64[:], int64)', cache=True)
+    def _haar_inverse_kernel(coeffs, length):
+        """Invert _haar_forward_kernel for a signal of the given length"""
+        if length <= 1:
+            return coeffs[:length].copy()
+            
+        # Signal length at every level, from the input down to one average
+        levels = 1
+        m = length
+        while m > 1:
+            m = (m + 1) // 2
+            levels += 1
+        sizes = np.empty(levels, dtype=np.int64)
+        sizes[0] = length
+        for level in range(1, levels):
+            sizes[level] = (sizes[level - 1] + 1) // 2
+            
+        # Expand in place from the top level down, writing back to front so
+        # no average is overwritten before it is read
+        signal = np.empty(length)
+        signal[0] = coeffs[0]
+        pos = 1
+        for level in range(levels - 2, -1, -1):
+            m = sizes[level]
+            half = sizes[level + 1]
+            for i in range(half - 1, -1, -1):
+                a = signal[i]
+                d = coeffs[pos + i]
+                signal[2 * i] = a + d
+                if 2 * i + 1 < m:
+                    signal[2 * i + 1] = a - d
+            pos += half
+            
+        return signal
+
+
+def _haar_forward(signal: np.ndarray) -> np.ndarray:
+    """Haar wavelet-like transform: final average, then the differences of
+    each level from the coarsest to the finest
+
+    Odd-length levels are padded with a zero.
+    """
+    if NUMBA_AVAILABLE:
+        return _haar_forward_kernel(signal)
+        
+    averages = signal
+    differences = []
+    while averages.size > 1:
+        if averages.size % 2 == 1:
+            averages = np.append(averages, 0)
+        differences.append((averages[::2] - averages[1::2]) / 2)
+        averages = (averages[::2] + averages[1::2]) / 2
+        
+    return np.concatenate([averages] + differences[::-1])
+    
+    
+def _haar_inverse(coeffs: np.ndarray, length: int) -> np.ndarray:
+    """Invert _haar_forward for a signal of the given length"""
+    if NUMBA_AVAILABLE:
+        return _haar_inverse_kernel(coeffs, length)
+        
+    # Signal length at every level, from the input down to one average
+    sizes = [length]
+    while sizes[-1] > 1:
+        sizes.append((sizes[-1] + 1) // 2)
+        
+    signal = coeffs[:min(length, 1)]
+    pos = 1
+    for size in reversed(sizes[:-1]):
+        half = signal.size
+        differences = coeffs[pos:pos + half]
+        pos += half
+        
+        restored = np.empty(2 * half)
+        restored[::2] = signal + differences
+        restored[1::2] = signal - differences
+        signal = restored[:size]
+        
+    return signal
+
 
 class TensorEncoder(BaseEncoder):
     """
@@ -28,11 +150,9 @@ class TensorEncoder(BaseEncoder):
         """
         Encode string data using tensor operations
         """
-        # Convert to binary
-        binary_data = ''.join(format(ord(char), '08b') for char in data)
-        
-        # Convert binary to numerical array
-        data_array = np.array([float(bit) for bit in binary_data])
+        # Unpack the UTF-8 bytes into a numerical array of bits
+        raw = np.frombuffer(data.encode('utf-8'), dtype=np.uint8)
+        data_array = np.unpackbits(raw).astype(np.float64)
         
         # Choose tensor operation
         operation = np.random.choice(list(self.tensor_operations.keys()))
@@ -79,8 +199,8 @@ class TensorEncoder(BaseEncoder):
         operation = metadata['operation']
         data_array = self._reverse_tensor_operation(original_tensors, operation, metadata)
         
-        # Convert back to binary
-        binary_data = ''.join([str(int(round(bit))) for bit in data_array])
+        # Round back to bits and pack them into bytes
+        binary_data = np.packbits(np.rint(data_array) > 0).tobytes()
         
         # Convert binary to string
         original_data = self._binary_to_string(binary_data, metadata['original_length'])
@@ -155,8 +275,9 @@ class TensorEncoder(BaseEncoder):
         phase_shifts = np.random.uniform(0, 2*np.pi, len(data_array))
         shifted_fft = fft_data * np.exp(1j * phase_shifts)
         
-        # Create frequency domain mask
-        mask = np.random.choice([0, 1], size=len(data_array), p=[0.3, 0.7])
+        # Create frequency domain mask; its gains are nonzero so the masking
+        # can be divided out again
+        mask = np.random.uniform(0.5, 2.0, len(data_array))
         masked_fft = shifted_fft * mask
         
         return {
@@ -168,41 +289,17 @@ class TensorEncoder(BaseEncoder):
         
     def _wavelet_encode(self, data_array: np.ndarray) -> Dict[str, np.ndarray]:
         """Encode using wavelet-like transform"""
-        # Simple Haar wavelet-like transform
-        def haar_transform(signal):
-            n = len(signal)
-            if n == 1:
-                return signal
-                
-            # Ensure even length
-            if n % 2 == 1:
-                signal = np.append(signal, 0)
-                n += 1
-                
-            # Compute averages and differences
-            averages = (signal[::2] + signal[1::2]) / 2
-            differences = (signal[::2] - signal[1::2]) / 2
-            
-            # Recursively transform averages
-            transformed_averages = haar_transform(averages)
-            
-            return np.concatenate([transformed_averages, differences])
-            
-        # Apply wavelet transform
-        wavelet_coeffs = haar_transform(data_array)
+        # Apply simple Haar wavelet-like transform
+        wavelet_coeffs = _haar_forward(data_array)
         
-        # Apply random scaling to coefficients
+        # Apply random scaling to coefficients; they are stored unrounded so
+        # dividing by the scales recovers them to within a rounding error
         scales = np.random.uniform(0.5, 2.0, len(wavelet_coeffs))
         scaled_coeffs = wavelet_coeffs * scales
         
-        # Quantize coefficients
-        quantization_levels = np.random.randint(2, 16, len(wavelet_coeffs))
-        quantized_coeffs = np.round(scaled_coeffs * quantization_levels) / quantization_levels
-        
         return {
-            'quantized_coeffs': quantized_coeffs,
+            'scaled_coeffs': scaled_coeffs,
             'scales': scales,
-            'quantization_levels': quantization_levels,
             'original_shape': data_array.shape
         }
         
@@ -220,8 +317,11 @@ class TensorEncoder(BaseEncoder):
         # Apply SVD
         U, s, Vt = np.linalg.svd(data_matrix, full_matrices=False)
         
-        # Modify singular values
-        modified_s = s + np.random.normal(0, 0.1, len(s))
+        # Modify singular values, rescaling U's columns to match so the
+        # product U @ diag(s) @ Vt is unchanged
+        factors = np.random.uniform(0.5, 2.0, len(s))
+        modified_s = s * factors
+        U = U / factors
         
         # Randomly permute components
         perm_indices = np.random.permutation(len(s))
@@ -243,13 +343,15 @@ class TensorEncoder(BaseEncoder):
         transformed = {}
         
         for key, tensor in tensor_data.items():
-            if isinstance(tensor, np.ndarray):
+            # Integer tensors (permutations, sizes) are kept exact
+            if isinstance(tensor, np.ndarray) and np.issubdtype(tensor.dtype, np.inexact):
                 # Apply random linear transformation
                 if tensor.ndim == 1:
-                    # Vector transformation
-                    transform_matrix = np.random.randn(len(tensor), len(tensor))
-                    transformed[key] = transform_matrix @ tensor
-                    transformed[f'{key}_transform'] = transform_matrix
+                    # Vector transformation: a random per-element scaling, so
+                    # the stored transform grows linearly with the vector
+                    transform_scales = np.random.uniform(0.5, 2.0, len(tensor))
+                    transformed[key] = tensor * transform_scales
+                    transformed[f'{key}_transform'] = transform_scales
                 elif tensor.ndim == 2:
                     # Matrix transformation
                     left_transform = np.random.randn(tensor.shape[0], tensor.shape[0])
@@ -286,8 +388,7 @@ class TensorEncoder(BaseEncoder):
             if isinstance(tensor, np.ndarray):
                 if tensor.ndim == 1 and f'{key}_transform' in tensors:
                     # Reverse vector transformation
-                    transform_matrix = tensors[f'{key}_transform']
-                    original[key] = np.linalg.solve(transform_matrix, tensor)
+                    original[key] = tensor / tensors[f'{key}_transform']
                 elif tensor.ndim == 2 and f'{key}_left_transform' in tensors:
                     # Reverse matrix transformation
                     left_transform = tensors[f'{key}_left_transform']
@@ -334,37 +435,40 @@ class TensorEncoder(BaseEncoder):
         return rotation
         
     def _serialize_tensors(self, tensors: Dict[str, np.ndarray]) -> Dict[str, Any]:
-        """Serialize tensors for JSON storage"""
-        serialized = {}
+        """Serialize tensors as raw arrays in a base64 .npz buffer
+
+        Lists of arrays are stored as numbered entries; other values stay
+        in the JSON header.
+        """
+        arrays = {}
+        array_lists = {}
+        values = {}
         for key, value in tensors.items():
             if isinstance(value, np.ndarray):
-                serialized[key] = {
-                    'data': value.tolist(),
-                    'shape': value.shape,
-                    'dtype': str(value.dtype)
-                }
-            elif isinstance(value, list) and all(isinstance(item, np.ndarray) for item in value):
-                serialized[key] = [
-                    {
-                        'data': item.tolist(),
-                        'shape': item.shape,
-                        'dtype': str(item.dtype)
-                    } for item in value
-                ]
+                arrays[key] = value
+            elif isinstance(value, list) and value and all(isinstance(item, np.ndarray) for item in value):
+                array_lists[key] = len(value)
+                arrays.update((f'{key}.{index}', item) for index, item in enumerate(value))
             else:
-                serialized[key] = value
-        return serialized
+                values[key] = value
+                
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+        return {
+            'arrays': base64.b64encode(buffer.getvalue()).decode('ascii'),
+            'array_lists': array_lists,
+            'values': values
+        }
         
     def _deserialize_tensors(self, serialized: Dict[str, Any]) -> Dict[str, np.ndarray]:
-        """Deserialize tensors from JSON storage"""
-        tensors = {}
-        for key, value in serialized.items():
-            if isinstance(value, dict) and 'data' in value:
-                tensors[key] = np.array(value['data']).reshape(value['shape'])
-            elif isinstance(value, list) and all(isinstance(item, dict) and 'data' in item for item in value):
-                tensors[key] = [np.array(item['data']).reshape(item['shape']) for item in value]
-            else:
-                tensors[key] = value
+        """Load the tensors written by _serialize_tensors"""
+        payload = base64.b64decode(serialized['arrays'])
+        with np.load(io.BytesIO(payload), allow_pickle=False) as arrays:
+            tensors = {name: arrays[name] for name in arrays.files}
+            
+        for key, count in serialized['array_lists'].items():
+            tensors[key] = [tensors.pop(f'{key}.{index}') for index in range(count)]
+        tensors.update(serialized['values'])
         return tensors
         
     def _generate_tensor_metadata(self, data_shape: Tuple, operation: str) -> Dict[str, Any]:
@@ -415,10 +519,10 @@ class TensorEncoder(BaseEncoder):
         rotations = tensors['rotations']
         original_shape = tensors['original_shape']
         
-        # Reverse rotations
+        # Reverse rotations, last applied first, each along its own mode
         data_tensor = encoded_tensor.copy()
-        for i, rotation in enumerate(reversed(rotations)):
-            data_tensor = np.tensordot(np.linalg.inv(rotation), data_tensor, axes=([1], [i]))
+        for i in reversed(range(len(rotations))):
+            data_tensor = np.tensordot(np.linalg.inv(rotations[i]), data_tensor, axes=([1], [i]))
             data_tensor = np.moveaxis(data_tensor, 0, i)
             
         # Flatten and trim
@@ -432,8 +536,8 @@ class TensorEncoder(BaseEncoder):
         phase_shifts = tensors['phase_shifts']
         frequency_mask = tensors['frequency_mask']
         
-        # Reverse masking (approximate)
-        unmasked_fft = masked_fft / (frequency_mask + 1e-10)
+        # Reverse masking
+        unmasked_fft = masked_fft / frequency_mask
         
         # Reverse phase shifts
         original_fft = unmasked_fft * np.exp(-1j * phase_shifts)
@@ -445,35 +549,14 @@ class TensorEncoder(BaseEncoder):
         
     def _reverse_wavelet(self, tensors: Dict[str, np.ndarray]) -> np.ndarray:
         """Reverse wavelet transform encoding"""
-        quantized_coeffs = tensors['quantized_coeffs']
+        scaled_coeffs = tensors['scaled_coeffs']
         scales = tensors['scales']
         
         # Reverse scaling
-        wavelet_coeffs = quantized_coeffs / scales
+        wavelet_coeffs = scaled_coeffs / scales
         
-        # Inverse Haar transform (simplified)
-        def inverse_haar_transform(coeffs):
-            n = len(coeffs)
-            if n == 1:
-                return coeffs
-                
-            # Split into averages and differences
-            mid = n // 2
-            averages = coeffs[:mid]
-            differences = coeffs[mid:]
-            
-            # Recursively inverse transform averages
-            if len(averages) > 1:
-                averages = inverse_haar_transform(averages)
-                
-            # Reconstruct signal
-            signal = np.zeros(n)
-            signal[::2] = averages + differences[:len(averages)]
-            signal[1::2] = averages - differences[:len(averages)]
-            
-            return signal
-            
-        data_array = inverse_haar_transform(wavelet_coeffs)
+        # Inverse Haar transform back to the original number of bits
+        data_array = _haar_inverse(wavelet_coeffs, int(tensors['original_shape'][0]))
         
         return data_array
         
@@ -499,20 +582,6 @@ class TensorEncoder(BaseEncoder):
         
         return data_array
         
-    def _binary_to_string(self, binary_data: str, original_length: int) -> str:
-        """Convert binary data back to string"""
-        # Ensure binary data is multiple of 8
-        while len(binary_data) % 8 != 0:
-            binary_data += '0'
-            
-        chars = []
-        for i in range(0, len(binary_data), 8):
-            byte = binary_data[i:i+8]
-            if len(byte) == 8:
-                try:
-                    chars.append(chr(int(byte, 2)))
-                except ValueError:
-                    chars.append('\x00')
-                    
-        result = ''.join(chars)
-        return result[:original_length]
+    def _binary_to_string(self, binary_data: bytes, original_length: int) -> str:
+        """Convert packed UTF-8 bytes back to string"""
+        return binary_data.decode('utf-8', errors='replace')[:original_length]
@@ -4,15 +4,18 @@ GUI interface for ObfusLite
 Provides a user-friendly graphical interface for code obfuscation with multi-file support.
 """
 
+import ast
+import hashlib
 import sys
 import json
 import os
 import time
 import shutil
-import zipfile
+import stat
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from collections import Counter
+from functools import lru_cache, partial
 
 try:
     from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout,
@@ -22,15 +25,299 @@ try:
                                 QSplitter, QTableWidget, QTableWidgetItem, QHeaderView,
                                 QTreeWidget, QTreeWidgetItem, QScrollArea, QFrame,
                                 QSlider, QDoubleSpinBox, QLineEdit, QTextBrowser,
-                                QInputDialog)
-    from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-    from PyQt6.QtGui import QFont, QTextCharFormat, QColor, QPixmap, QIcon
+                                QInputDialog, QListView)
+    from PyQt6.QtCore import (Qt, QThread, pyqtSignal, QTimer, QObject, QRunnable, QThreadPool,
+                              QStringListModel)
+    from PyQt6.QtGui import QFont, QTextCharFormat, QColor, QPixmap, QIcon, QTextCursor
     PYQT_AVAILABLE = True
 except ImportError:
     PYQT_AVAILABLE = False
 
 from . import Obfuscator, get_available_techniques, get_fast_techniques, __version__
 
+# Size of each block appended when streaming large outputs into a text widget
+TEXT_CHUNK_SIZE = 65536
+
+# Limits for the obfuscated data preview; saving always writes the full result
+PREVIEW_VALUE_LIMIT = 4096
+PREVIEW_TEXT_LIMIT = 65536
+
+# Status message template reused for every file in a batch
+_PROCESSED_STATUS = "Processed %d/%d files (last: %s)"
+
+# Minimum interval in seconds between repeated progress/status signals
+SIGNAL_INTERVAL = 0.05
+
+# Delay in milliseconds used to coalesce batch result rows into one table update
+TABLE_FLUSH_INTERVAL = 50
+
+# Source files larger than this are memory-mapped instead of read into a buffer
+MMAP_THRESHOLD = 1024 * 1024
+
+# Worker processes for batch obfuscation, leaving one core for the GUI
+BATCH_MAX_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+
+# Number of code analysis results kept, keyed by source hash
+ANALYSIS_CACHE_SIZE = 64
+
+
+# AST node types counted by code analysis, keyed to the metric they contribute to
+_AST_METRIC_TYPES = {
+    ast.FunctionDef: 'functions',
+    ast.ClassDef: 'classes',
+    ast.Import: 'imports',
+    ast.ImportFrom: 'imports',
+    ast.If: 'complexity',
+    ast.For: 'complexity',
+    ast.While: 'complexity',
+    ast.Try: 'complexity',
+}
+
+
+def _count_ast_metrics(tree):
+    """Count functions, classes, imports and branches in a single pass over the tree"""
+    # Counter consumes the walk in C, avoiding a Python-level isinstance chain per node
+    type_counts = Counter(map(type, ast.walk(tree)))
+    metrics = {'functions': 0, 'classes': 0, 'imports': 0, 'complexity': 0}
+    for node_type, metric in _AST_METRIC_TYPES.items():
+        metrics[metric] += type_counts[node_type]
+    return metrics
+
+
+@lru_cache(maxsize=1)
+def _orjson():
+    """Return the optional orjson module, or None; imported on first use"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+@lru_cache(maxsize=1)
+def _ijson():
+    """Return the optional ijson streaming parser, or None; imported on first use"""
+    try:
+        import ijson
+    except ImportError:
+        return None
+    return ijson
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj as indented UTF-8 JSON, using orjson when available"""
+    orjson = _orjson()
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects some values (e.g. integers wider than 64 bits)
+            pass
+    return json.dumps(obj, indent=2, default=str).encode('utf-8')
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _extract_json_string(file_path, key):
+    """Return the top-level string value for key in a JSON file, or None
+
+    With ijson installed the file is scanned as a stream instead of being
+    decoded into a full dictionary.
+    """
+    ijson = _ijson()
+    if ijson is not None:
+        with open(file_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == key and event == 'string':
+                    return value
+        return None
+
+    data = _json_loads(Path(file_path).read_bytes())
+    value = data.get(key) if isinstance(data, dict) else None
+    return value if isinstance(value, str) else None
+
+
+def _file_digest(file_path):
+    """Hash a file's contents in fixed-size chunks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(partial(f.read, 65536), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _write_if_changed(file_path, data):
+    """Atomically write data to file_path unless it already holds identical bytes
+
+    An existing file keeps its permission bits and a symlink is written
+    through rather than replaced. Returns True if the file was written.
+    """
+    try:
+        st = os.stat(file_path)
+        if (st.st_size == len(data)
+                and _file_digest(file_path) == hashlib.blake2b(data, digest_size=16).digest()):
+            return False
+        mode = stat.S_IMODE(st.st_mode)
+    except OSError:
+        mode = None
+
+    if os.path.islink(file_path):
+        with open(file_path, 'wb') as f:
+            f.write(data)
+        return True
+
+    # A unique temporary file per write, so concurrent writers never share
+    # one; os.open applies the process umask to a new file's permissions
+    directory, name = os.path.split(file_path)
+    temp_path = os.path.join(directory, f".{name}.{os.urandom(8).hex()}.tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def _write_json(file_path, obj):
+    """Write obj to file_path as indented JSON"""
+    with open(file_path, 'wb') as f:
+        f.write(_json_dumps(obj))
+
+
+def _save_json(file_path, obj):
+    """Write obj to file_path as indented JSON, atomically and only if changed"""
+    _write_if_changed(file_path, _json_dumps(obj))
+
+
+def _write_text(file_path, text):
+    """Write text to file_path as UTF-8"""
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _write_csv(file_path, header, rows):
+    """Write a header and rows to file_path as CSV"""
+    import csv
+    with open(file_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _create_zip(zip_path, source_dir):
+    """Archive the .py and .json files directly inside source_dir"""
+    import zipfile
+    # Batch output is written flat, and a low deflate level keeps archiving cheap
+    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        with os.scandir(source_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(('.py', '.json')) and entry.is_file():
+                    zipf.write(entry.path, entry.name)
+
+
+def _count_lines(text):
+    """Count lines like len(text.splitlines()) without building the list"""
+    if not text:
+        return 0
+    return text.count('\n') + (0 if text.endswith('\n') else 1)
+
+
+def _compression_ratio(result):
+    """Format the size change of an obfuscation result as a percentage string"""
+    ratio = (1 - result.get('obfuscated_size', 0) / max(result.get('original_size', 1), 1)) * 100
+    return f"{ratio:.2f}%"
+
+
+def _preview_json(data):
+    """Render a result dict as JSON for display, truncating large values"""
+    preview = {
+        key: (f"<{len(value)} characters truncated>"
+              if isinstance(value, (str, bytes)) and len(value) > PREVIEW_VALUE_LIMIT else value)
+        for key, value in data.items()
+    }
+    text = _json_dumps(preview).decode('utf-8')
+    if len(text) > PREVIEW_TEXT_LIMIT:
+        text = text[:PREVIEW_TEXT_LIMIT] + "\n... (preview truncated, save the obfuscated data for the full output)"
+    return text
+
+
+def _read_source(file_path):
+    """Read a source file as UTF-8, replacing undecodable bytes"""
+    if os.path.getsize(file_path) > MMAP_THRESHOLD:
+        import mmap
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return str(view, 'utf-8', 'replace')
+    return Path(file_path).read_bytes().decode('utf-8', 'replace')
+
+
+@lru_cache(maxsize=1)
+def _shared_obfuscator():
+    """Return the Obfuscator shared by the GUI and workers in this process"""
+    return Obfuscator()
+
+
+@lru_cache(maxsize=8)
+def _batch_pipeline(technique, layers, seed):
+    """Return an (obfuscator, pipeline) pair, built once per process and configuration"""
+    obfuscator = _shared_obfuscator()
+    return obfuscator, obfuscator.compile_pipeline(technique, layers, seed)
+
+
+def _obfuscate_file(file_path, technique, layers, seed, output_dir=None):
+    """Read and obfuscate a single file; runs in batch worker processes
+
+    When output_dir is given the obfuscated data and standalone code are
+    written there as well, keeping disk I/O off the GUI thread.
+    """
+    obfuscator, run_one = _batch_pipeline(technique, layers, seed)
+    result = run_one(_read_source(file_path))
+    result['standalone_code'] = obfuscator.create_standalone_file(result)
+    result['original_file'] = file_path
+
+    if output_dir:
+        base_name = os.path.splitext(os.path.basename(file_path))[0]
+
+        # Save obfuscated data
+        obfuscated_file = os.path.join(output_dir, f"{base_name}_obfuscated.json")
+        _write_json(obfuscated_file, result)
+
+        # Save standalone code
+        standalone_file = os.path.join(output_dir, f"{base_name}_standalone.py")
+        with open(standalone_file, 'w', encoding='utf-8') as f:
+            f.write(result['standalone_code'])
+
+    return result
+
+
+def _iter_py_files(root):
+    """Yield paths of Python files under root using an iterative os.scandir walk"""
+    # An explicit stack avoids nested generators and recursion limits on deep trees
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+
 if PYQT_AVAILABLE:
     class ObfuscationWorker(QThread):
         """Worker thread for obfuscation to prevent GUI freezing"""
@@ -45,11 +332,13 @@ if PYQT_AVAILABLE:
             self.layers = layers
             self.seed = seed
             self.performance_mode = performance_mode
+            self.obfuscator = None
 
         def run(self):
             try:
-                # Initialize obfuscator
-                obfuscator = Obfuscator()
+                # Reuse the process-wide obfuscator
+                obfuscator = _shared_obfuscator()
+                self.obfuscator = obfuscator
 
                 self.progress.emit(25)
 
@@ -61,12 +350,7 @@ if PYQT_AVAILABLE:
                     seed=self.seed
                 )
 
-                self.progress.emit(80)
-
-                # Generate standalone executable code
-                standalone_code = obfuscator.create_standalone_file(result)
-                result['standalone_code'] = standalone_code
-
+                # Standalone code is generated lazily by the GUI when needed
                 self.progress.emit(100)
                 self.finished.emit(result)
 
@@ -91,44 +375,82 @@ if PYQT_AVAILABLE:
 
         def run(self):
             try:
-                obfuscator = Obfuscator()
                 total_files = len(self.file_paths)
+                base_names = {path: os.path.basename(path) for path in self.file_paths}
 
-                for i, file_path in enumerate(self.file_paths):
-                    try:
-                        self.status_update.emit(f"Processing {os.path.basename(file_path)}...")
-
-                        # Read file
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            code = f.read()
-
-                        # Obfuscate
-                        result = obfuscator.obfuscate(
-                            code,
-                            technique=self.technique,
-                            layers=self.layers,
-                            seed=self.seed
-                        )
+                # Coalesce cross-thread signals so large batches don't flood the GUI thread
+                last_progress = -1
+                last_progress_time = 0.0
+                last_status_time = 0.0
 
-                        # Generate standalone code
-                        standalone_code = obfuscator.create_standalone_file(result)
-                        result['standalone_code'] = standalone_code
-                        result['original_file'] = file_path
+                for i, (file_path, result, error) in enumerate(self._iter_results()):
+                    now = time.monotonic()
+                    if i == 0 or now - last_status_time >= SIGNAL_INTERVAL:
+                        self.status_update.emit(_PROCESSED_STATUS % (i + 1, total_files,
+                                                                     base_names[file_path]))
+                        last_status_time = now
 
+                    if error is None:
                         self.file_finished.emit(file_path, result)
-
-                    except Exception as e:
-                        self.file_error.emit(file_path, str(e))
+                    else:
+                        self.file_error.emit(file_path, str(error))
 
                     # Update progress
-                    progress = int((i + 1) / total_files * 100)
-                    self.progress.emit(progress)
+                    progress = (i + 1) * 100 // total_files
+                    if progress != last_progress or now - last_progress_time >= SIGNAL_INTERVAL:
+                        self.progress.emit(progress)
+                        last_progress = progress
+                        last_progress_time = now
 
                 self.status_update.emit("Batch processing completed!")
 
             except Exception as e:
                 self.status_update.emit(f"Batch processing failed: {str(e)}")
 
+        def _iter_results(self):
+            """Yield (file_path, result, error) for each file as it completes"""
+            args = (self.technique, self.layers, self.seed, self.output_dir)
+
+            # Files are independent, so large batches are spread across processes
+            if BATCH_MAX_WORKERS > 1 and len(self.file_paths) > BATCH_MAX_WORKERS:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor, as_completed
+                with ProcessPoolExecutor(max_workers=BATCH_MAX_WORKERS,
+                                         mp_context=multiprocessing.get_context('spawn')) as pool:
+                    futures = {pool.submit(_obfuscate_file, path, *args): path
+                               for path in self.file_paths}
+                    for future in as_completed(futures):
+                        try:
+                            yield futures[future], future.result(), None
+                        except Exception as e:
+                            yield futures[future], None, e
+            else:
+                for path in self.file_paths:
+                    try:
+                        yield path, _obfuscate_file(path, *args), None
+                    except Exception as e:
+                        yield path, None, e
+
+    class BackgroundTaskSignals(QObject):
+        """Signals emitted by BackgroundTask"""
+        finished = pyqtSignal()
+        error = pyqtSignal(str)
+
+    class BackgroundTask(QRunnable):
+        """Runs a callable on the global thread pool, used for disk writes"""
+
+        def __init__(self, func):
+            super().__init__()
+            self.func = func
+            self.signals = BackgroundTaskSignals()
+
+        def run(self):
+            try:
+                self.func()
+                self.signals.finished.emit()
+            except Exception as e:
+                self.signals.error.emit(str(e))
+
     class CodeAnalysisWorker(QThread):
         """Worker thread for code analysis"""
         analysis_finished = pyqtSignal(dict)
@@ -140,8 +462,6 @@ if PYQT_AVAILABLE:
 
         def run(self):
             try:
-                import ast
-
                 # Parse the code
                 tree = ast.parse(self.code)
 
@@ -149,21 +469,8 @@ if PYQT_AVAILABLE:
                 analysis = {
                     'lines': len(self.code.splitlines()),
                     'characters': len(self.code),
-                    'functions': 0,
-                    'classes': 0,
-                    'imports': 0,
-                    'complexity': 0
                 }
-
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        analysis['functions'] += 1
-                    elif isinstance(node, ast.ClassDef):
-                        analysis['classes'] += 1
-                    elif isinstance(node, (ast.Import, ast.ImportFrom)):
-                        analysis['imports'] += 1
-                    elif isinstance(node, (ast.If, ast.For, ast.While, ast.Try)):
-                        analysis['complexity'] += 1
+                analysis.update(_count_ast_metrics(tree))
 
                 self.analysis_finished.emit(analysis)
 
@@ -177,8 +484,16 @@ if PYQT_AVAILABLE:
             super().__init__()
             self.obfuscation_result = None
             self.batch_results = {}
+            self._batch_rows = []
+            self._pending_batch_rows = []
             self.current_project = None
             self.templates = {}
+            self._text_stream_ids = {}
+            self._standalone_factory = None
+            self._analysis_cache = {}
+            self._background_tasks = set()
+            self._batch_paths = set()
+            self._batch_path_list = []
             self.load_templates()
             self.initUI()
 
@@ -210,11 +525,59 @@ if PYQT_AVAILABLE:
             try:
                 templates_file = Path.home() / '.obfuslite_templates.json'
                 if templates_file.exists():
-                    with open(templates_file, 'r') as f:
-                        self.templates = json.load(f)
+                    self.templates = _json_loads(templates_file.read_bytes())
             except Exception:
                 self.templates = {}
 
+        def run_in_background(self, func, success_message, error_prefix, button=None):
+            """Run a blocking save operation off the GUI thread and report the outcome"""
+            task = BackgroundTask(func)
+            self._background_tasks.add(task)
+            if button is not None:
+                button.setEnabled(False)
+
+            def done():
+                self._background_tasks.discard(task)
+                if button is not None:
+                    button.setEnabled(True)
+
+            def on_finished():
+                done()
+                if success_message:
+                    QMessageBox.information(self, "Success", success_message)
+
+            def on_error(error):
+                done()
+                QMessageBox.critical(self, "Error", f"{error_prefix}: {error}")
+
+            task.signals.finished.connect(on_finished)
+            task.signals.error.connect(on_error)
+            QThreadPool.globalInstance().start(task)
+
+        def _set_text_async(self, edit, text, chunk=TEXT_CHUNK_SIZE):
+            """Fill a text widget in chunks so large outputs don't block the event loop"""
+            # Each call supersedes any stream still running for the same widget
+            stream_id = self._text_stream_ids.get(id(edit), 0) + 1
+            self._text_stream_ids[id(edit)] = stream_id
+
+            if len(text) <= chunk:
+                edit.setPlainText(text)
+                return
+
+            edit.clear()
+            position = [0]
+
+            def step():
+                if self._text_stream_ids.get(id(edit)) != stream_id:
+                    return
+                edit.moveCursor(QTextCursor.MoveOperation.End)
+                edit.insertPlainText(text[position[0]:position[0] + chunk])
+                position[0] += chunk
+                if position[0] < len(text):
+                    QTimer.singleShot(0, step)
+
+            step()
+
         def create_obfuscation_tab(self):
             """Create the main obfuscation tab"""
             obfuscation_widget = QWidget()
@@ -317,6 +680,7 @@ if PYQT_AVAILABLE:
             self.metadata_text = QTextEdit()
             self.metadata_text.setReadOnly(True)
             self.output_tabs.addTab(self.metadata_text, "Metadata")
+            self.output_tabs.currentChanged.connect(self.on_output_tab_changed)
 
             output_layout.addWidget(self.output_tabs)
 
@@ -513,7 +877,11 @@ if PYQT_AVAILABLE:
             file_layout.addLayout(file_controls)
 
             # File list
-            self.batch_file_list = QListWidget()
+            # A model-backed view avoids allocating a QListWidgetItem per file
+            self._batch_model = QStringListModel()
+            self.batch_file_list = QListView()
+            self.batch_file_list.setModel(self._batch_model)
+            self.batch_file_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
             self.batch_file_list.setMinimumHeight(150)
             file_layout.addWidget(self.batch_file_list)
 
@@ -610,6 +978,12 @@ if PYQT_AVAILABLE:
             self.batch_results_table.horizontalHeader().setStretchLastSection(True)
             results_layout.addWidget(self.batch_results_table)
 
+            # Completed files are buffered and inserted into the table in bulk
+            self._batch_flush_timer = QTimer(self)
+            self._batch_flush_timer.setSingleShot(True)
+            self._batch_flush_timer.setInterval(TABLE_FLUSH_INTERVAL)
+            self._batch_flush_timer.timeout.connect(self._flush_batch_rows)
+
             # Export buttons
             export_layout = QHBoxLayout()
             self.export_batch_button = QPushButton("Export Results")
@@ -847,8 +1221,20 @@ if PYQT_AVAILABLE:
             self.tab_widget.addTab(deobfuscation_widget, "Deobfuscation")
 
         def create_settings_tab(self):
-            """Create the settings tab"""
-            settings_widget = QWidget()
+            """Create the settings tab; its contents are built when first shown"""
+            self.settings_widget = QWidget()
+            self._settings_built = False
+            self.tab_widget.addTab(self.settings_widget, "Settings")
+            self.tab_widget.currentChanged.connect(self.on_tab_changed)
+
+        def on_tab_changed(self, index):
+            """Build deferred tab contents on first show"""
+            if self.tab_widget.widget(index) is self.settings_widget and not self._settings_built:
+                self.build_settings_tab()
+
+        def build_settings_tab(self):
+            """Populate the settings tab"""
+            self._settings_built = True
             layout = QVBoxLayout()
 
             # Technique descriptions
@@ -867,8 +1253,7 @@ if PYQT_AVAILABLE:
             layout.addWidget(desc_group)
 
             layout.addStretch()
-            settings_widget.setLayout(layout)
-            self.tab_widget.addTab(settings_widget, "Settings")
+            self.settings_widget.setLayout(layout)
 
         def update_technique_list(self):
             """Update available techniques based on performance mode"""
@@ -922,10 +1307,13 @@ if PYQT_AVAILABLE:
         def on_obfuscation_finished(self, result):
             """Handle obfuscation completion"""
             self.obfuscation_result = result
+            self._standalone_factory = partial(self.worker.obfuscator.create_standalone_file, result)
 
-            # Display results
-            self.obfuscated_data_text.setText(json.dumps(result, indent=2, default=str))
-            self.standalone_code_text.setText(result.get('standalone_code', ''))
+            # Display results; standalone code is only rendered once its tab is shown
+            self._set_text_async(self.obfuscated_data_text, _preview_json(result))
+            self.standalone_code_text.clear()
+            if self.output_tabs.currentWidget() is self.standalone_code_text:
+                self._set_text_async(self.standalone_code_text, self.ensure_standalone_code())
 
             # Display metadata
             metadata = {
@@ -934,7 +1322,7 @@ if PYQT_AVAILABLE:
                 'obfuscation_id': result.get('obfuscation_id'),
                 'original_size': result.get('original_size'),
                 'obfuscated_size': result.get('obfuscated_size'),
-                'compression_ratio': f"{(1 - result.get('obfuscated_size', 0) / max(result.get('original_size', 1), 1)) * 100:.2f}%"
+                'compression_ratio': _compression_ratio(result)
             }
             self.metadata_text.setText(json.dumps(metadata, indent=2))
 
@@ -944,6 +1332,21 @@ if PYQT_AVAILABLE:
 
             QMessageBox.information(self, "Success", "Code obfuscated successfully!")
 
+        def ensure_standalone_code(self):
+            """Generate the standalone code for the current result on first use"""
+            if not self.obfuscation_result:
+                return ''
+            if 'standalone_code' not in self.obfuscation_result and self._standalone_factory:
+                self.obfuscation_result['standalone_code'] = self._standalone_factory()
+                self._standalone_factory = None
+            return self.obfuscation_result.get('standalone_code', '')
+
+        def on_output_tab_changed(self, index):
+            """Render the standalone code when its tab is first shown"""
+            if (self.output_tabs.widget(index) is self.standalone_code_text
+                    and self._standalone_factory is not None):
+                self._set_text_async(self.standalone_code_text, self.ensure_standalone_code())
+
         def on_obfuscation_error(self, error_msg):
             """Handle obfuscation error"""
             self.progress_bar.setVisible(False)
@@ -959,11 +1362,10 @@ if PYQT_AVAILABLE:
 
             try:
                 # Parse obfuscated data
-                data = json.loads(obfuscated_data)
+                data = _json_loads(obfuscated_data)
 
                 # Deobfuscate
-                obfuscator = Obfuscator()
-                original_code = obfuscator.deobfuscate(data)
+                original_code = _shared_obfuscator().deobfuscate(data)
 
                 # Display result
                 self.deobfuscated_output.setText(original_code)
@@ -979,24 +1381,31 @@ if PYQT_AVAILABLE:
             file_paths, _ = QFileDialog.getOpenFileNames(
                 self, "Select Python Files", "", "Python Files (*.py);;All Files (*)"
             )
-            for file_path in file_paths:
-                if file_path not in [self.batch_file_list.item(i).text() for i in range(self.batch_file_list.count())]:
-                    self.batch_file_list.addItem(file_path)
+            self._add_unique_batch_files(file_paths)
 
         def add_batch_directory(self):
             """Add all Python files from a directory"""
             directory = QFileDialog.getExistingDirectory(self, "Select Directory")
             if directory:
-                for root, _, files in os.walk(directory):
-                    for file in files:
-                        if file.endswith('.py'):
-                            file_path = os.path.join(root, file)
-                            if file_path not in [self.batch_file_list.item(i).text() for i in range(self.batch_file_list.count())]:
-                                self.batch_file_list.addItem(file_path)
+                self._add_unique_batch_files(_iter_py_files(directory))
+
+        def _add_unique_batch_files(self, file_paths):
+            """Append paths not already in the batch list"""
+            to_add = []
+            for file_path in file_paths:
+                if file_path not in self._batch_paths:
+                    self._batch_paths.add(file_path)
+                    to_add.append(file_path)
+            if to_add:
+                self._batch_path_list.extend(to_add)
+                # Single model update regardless of how many files were added
+                self._batch_model.setStringList(self._batch_path_list)
 
         def clear_batch_files(self):
             """Clear all files from batch list"""
-            self.batch_file_list.clear()
+            self._batch_model.setStringList([])
+            self._batch_path_list = []
+            self._batch_paths.clear()
 
         def select_batch_output(self):
             """Select output directory for batch processing"""
@@ -1006,7 +1415,7 @@ if PYQT_AVAILABLE:
 
         def start_batch_processing(self):
             """Start batch processing of all files"""
-            if self.batch_file_list.count() == 0:
+            if not self._batch_path_list:
                 QMessageBox.warning(self, "Warning", "No files selected for processing.")
                 return
 
@@ -1022,7 +1431,7 @@ if PYQT_AVAILABLE:
             performance_mode = self.batch_performance_combo.currentText()
 
             # Collect file paths
-            file_paths = [self.batch_file_list.item(i).text() for i in range(self.batch_file_list.count())]
+            file_paths = list(self._batch_path_list)
 
             # Create output directory if it doesn't exist
             os.makedirs(output_dir, exist_ok=True)
@@ -1033,8 +1442,12 @@ if PYQT_AVAILABLE:
             self.batch_process_button.setEnabled(False)
 
             # Clear previous results
+            self._batch_flush_timer.stop()
+            self.batch_results_table.setSortingEnabled(False)
             self.batch_results_table.setRowCount(0)
             self.batch_results = {}
+            self._batch_rows = []
+            self._pending_batch_rows = []
 
             # Start batch worker
             self.batch_worker = BatchObfuscationWorker(
@@ -1049,64 +1462,69 @@ if PYQT_AVAILABLE:
 
         def on_batch_file_finished(self, file_path, result):
             """Handle completion of a single file in batch processing"""
+            result['compression_ratio'] = _compression_ratio(result)
             self.batch_results[file_path] = result
 
-            # Add to results table
-            row = self.batch_results_table.rowCount()
-            self.batch_results_table.insertRow(row)
-
-            self.batch_results_table.setItem(row, 0, QTableWidgetItem(os.path.basename(file_path)))
-            self.batch_results_table.setItem(row, 1, QTableWidgetItem("Success"))
-            self.batch_results_table.setItem(row, 2, QTableWidgetItem(str(result.get('original_size', 0))))
-            self.batch_results_table.setItem(row, 3, QTableWidgetItem(str(result.get('obfuscated_size', 0))))
-
-            # Save obfuscated files
-            output_dir = self.batch_output_line.text()
-            base_name = os.path.splitext(os.path.basename(file_path))[0]
-
-            # Save obfuscated data
-            obfuscated_file = os.path.join(output_dir, f"{base_name}_obfuscated.json")
-            with open(obfuscated_file, 'w') as f:
-                json.dump(result, f, indent=2, default=str)
-
-            # Save standalone code
-            standalone_file = os.path.join(output_dir, f"{base_name}_standalone.py")
-            with open(standalone_file, 'w') as f:
-                f.write(result['standalone_code'])
+            # Add to results table; output files have already been written by the batch worker
+            self._add_batch_row((
+                os.path.basename(file_path),
+                "Success",
+                str(result.get('original_size', 0)),
+                str(result.get('obfuscated_size', 0)),
+            ))
 
         def on_batch_file_error(self, file_path, error):
             """Handle error in batch processing"""
-            row = self.batch_results_table.rowCount()
-            self.batch_results_table.insertRow(row)
+            self._add_batch_row((os.path.basename(file_path), f"Error: {error}", "N/A", "N/A"))
+
+        def _add_batch_row(self, row_values):
+            """Queue a results row and record it in the Python-side mirror used for export"""
+            self._batch_rows.append(row_values)
+            self._pending_batch_rows.append(row_values)
+            if not self._batch_flush_timer.isActive():
+                self._batch_flush_timer.start()
+
+        def _flush_batch_rows(self):
+            """Insert all queued rows into the results table with a single repaint"""
+            if not self._pending_batch_rows:
+                return
+            rows, self._pending_batch_rows = self._pending_batch_rows, []
 
-            self.batch_results_table.setItem(row, 0, QTableWidgetItem(os.path.basename(file_path)))
-            self.batch_results_table.setItem(row, 1, QTableWidgetItem(f"Error: {error}"))
-            self.batch_results_table.setItem(row, 2, QTableWidgetItem("N/A"))
-            self.batch_results_table.setItem(row, 3, QTableWidgetItem("N/A"))
+            table = self.batch_results_table
+            table.setUpdatesEnabled(False)
+            try:
+                start = table.rowCount()
+                table.setRowCount(start + len(rows))
+                for offset, row_values in enumerate(rows):
+                    for column, value in enumerate(row_values):
+                        table.setItem(start + offset, column, QTableWidgetItem(value))
+            finally:
+                table.setUpdatesEnabled(True)
 
         def on_batch_processing_finished(self):
             """Handle completion of batch processing"""
+            self._batch_flush_timer.stop()
+            self._flush_batch_rows()
             self.batch_progress_bar.setVisible(False)
             self.batch_process_button.setEnabled(True)
 
-            # Create ZIP if requested
+            # Create ZIP if requested; completion is reported once it is written
             if self.create_zip_checkbox.isChecked():
                 self.create_batch_zip()
-
-            QMessageBox.information(self, "Success", "Batch processing completed!")
+            else:
+                QMessageBox.information(self, "Success", "Batch processing completed!")
 
         def create_batch_zip(self):
             """Create ZIP archive of batch results"""
+            from datetime import datetime
             output_dir = self.batch_output_line.text()
             zip_path = os.path.join(output_dir, f"obfuscated_batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip")
 
-            with zipfile.ZipFile(zip_path, 'w') as zipf:
-                for root, _, files in os.walk(output_dir):
-                    for file in files:
-                        if file.endswith(('.py', '.json')):
-                            file_path = os.path.join(root, file)
-                            arcname = os.path.relpath(file_path, output_dir)
-                            zipf.write(file_path, arcname)
+            self.run_in_background(
+                partial(_create_zip, zip_path, output_dir),
+                "Batch processing completed!", "Failed to create ZIP archive",
+                self.batch_process_button
+            )
 
         def export_batch_results(self):
             """Export batch processing results"""
@@ -1118,21 +1536,13 @@ if PYQT_AVAILABLE:
                 self, "Export Batch Results", "", "JSON Files (*.json);;CSV Files (*.csv)"
             )
             if file_path:
-                try:
-                    if file_path.endswith('.csv'):
-                        import csv
-                        with open(file_path, 'w', newline='') as f:
-                            writer = csv.writer(f)
-                            writer.writerow(['File', 'Status', 'Original Size', 'Obfuscated Size', 'Technique', 'Layers'])
-                            for i in range(self.batch_results_table.rowCount()):
-                                row = [self.batch_results_table.item(i, j).text() for j in range(4)]
-                                writer.writerow(row)
-                    else:
-                        with open(file_path, 'w') as f:
-                            json.dump(self.batch_results, f, indent=2, default=str)
-                    QMessageBox.information(self, "Success", "Results exported successfully!")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to export results: {str(e)}")
+                if file_path.endswith('.csv'):
+                    header = ['File', 'Status', 'Original Size', 'Obfuscated Size', 'Technique', 'Layers']
+                    write = partial(_write_csv, file_path, header, list(self._batch_rows))
+                else:
+                    write = partial(_write_json, file_path, dict(self.batch_results))
+                self.run_in_background(write, "Results exported successfully!",
+                                       "Failed to export results", self.export_batch_button)
 
         def view_batch_log(self):
             """View detailed batch processing log"""
@@ -1140,16 +1550,18 @@ if PYQT_AVAILABLE:
             log_dialog.setWindowTitle("Batch Processing Log")
             log_dialog.setText("Detailed processing information:")
 
-            log_text = ""
+            log_parts = []
             for file_path, result in self.batch_results.items():
-                log_text += f"File: {os.path.basename(file_path)}\n"
-                log_text += f"  Technique: {result.get('technique', 'N/A')}\n"
-                log_text += f"  Layers: {result.get('layers', 'N/A')}\n"
-                log_text += f"  Original Size: {result.get('original_size', 'N/A')} bytes\n"
-                log_text += f"  Obfuscated Size: {result.get('obfuscated_size', 'N/A')} bytes\n"
-                log_text += f"  Compression Ratio: {((1 - result.get('obfuscated_size', 0) / max(result.get('original_size', 1), 1)) * 100):.2f}%\n\n"
-
-            log_dialog.setDetailedText(log_text)
+                log_parts.append(
+                    f"File: {os.path.basename(file_path)}\n"
+                    f"  Technique: {result.get('technique', 'N/A')}\n"
+                    f"  Layers: {result.get('layers', 'N/A')}\n"
+                    f"  Original Size: {result.get('original_size', 'N/A')} bytes\n"
+                    f"  Obfuscated Size: {result.get('obfuscated_size', 'N/A')} bytes\n"
+                    f"  Compression Ratio: {result['compression_ratio']}\n\n"
+                )
+
+            log_dialog.setDetailedText(''.join(log_parts))
             log_dialog.exec()
 
         # Template management methods
@@ -1178,8 +1590,7 @@ if PYQT_AVAILABLE:
             """Save templates to file"""
             try:
                 templates_file = Path.home() / '.obfuslite_templates.json'
-                with open(templates_file, 'w') as f:
-                    json.dump(self.templates, f, indent=2)
+                _save_json(templates_file, self.templates)
             except Exception as e:
                 QMessageBox.warning(self, "Warning", f"Failed to save templates: {str(e)}")
 
@@ -1191,8 +1602,7 @@ if PYQT_AVAILABLE:
             )
             if file_path:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        self.analysis_code_input.setText(f.read())
+                    self.analysis_code_input.setPlainText(_read_source(file_path))
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to load file: {str(e)}")
 
@@ -1203,12 +1613,26 @@ if PYQT_AVAILABLE:
                 QMessageBox.warning(self, "Warning", "Please enter code to analyze.")
                 return
 
+            # Reuse the previous result when the same code is analyzed again
+            code_hash = hashlib.blake2b(code.encode('utf-8'), digest_size=16).digest()
+            cached = self._analysis_cache.get(code_hash)
+            if cached is not None:
+                self.on_analysis_finished(dict(cached))
+                return
+
             # Start analysis worker
             self.analysis_worker = CodeAnalysisWorker(code)
+            self.analysis_worker.analysis_finished.connect(partial(self._cache_analysis, code_hash))
             self.analysis_worker.analysis_finished.connect(self.on_analysis_finished)
             self.analysis_worker.error.connect(self.on_analysis_error)
             self.analysis_worker.start()
 
+        def _cache_analysis(self, code_hash, analysis):
+            """Remember an analysis result, evicting the oldest entry when full"""
+            if len(self._analysis_cache) >= ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.pop(next(iter(self._analysis_cache)))
+            self._analysis_cache[code_hash] = dict(analysis)
+
         def on_analysis_finished(self, analysis):
             """Handle analysis completion"""
             # Update metrics table
@@ -1268,8 +1692,7 @@ if PYQT_AVAILABLE:
             )
             if file_path:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        self.original_comparison_text.setText(f.read())
+                    self.original_comparison_text.setPlainText(_read_source(file_path))
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to load file: {str(e)}")
 
@@ -1280,14 +1703,13 @@ if PYQT_AVAILABLE:
             )
             if file_path:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        if file_path.endswith('.json'):
-                            # If it's a JSON file, extract the standalone code
-                            data = json.loads(content)
-                            if 'standalone_code' in data:
-                                content = data['standalone_code']
-                        self.obfuscated_comparison_text.setText(content)
+                    content = None
+                    if file_path.endswith('.json'):
+                        # If it's a JSON file, extract the standalone code
+                        content = _extract_json_string(file_path, 'standalone_code')
+                    if content is None:
+                        content = _read_source(file_path)
+                    self.obfuscated_comparison_text.setPlainText(content)
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to load file: {str(e)}")
 
@@ -1302,7 +1724,7 @@ if PYQT_AVAILABLE:
 
             # Calculate statistics
             stats = [
-                ("Lines", len(original.splitlines()), len(obfuscated.splitlines())),
+                ("Lines", _count_lines(original), _count_lines(obfuscated)),
                 ("Characters", len(original), len(obfuscated)),
                 ("Size Ratio", "1.0", f"{len(obfuscated) / len(original):.2f}"),
                 ("Readability", "High", "Low")
@@ -1318,6 +1740,7 @@ if PYQT_AVAILABLE:
         # Project management methods
         def new_project(self):
             """Create a new project"""
+            from datetime import datetime
             self.current_project = {
                 'name': '',
                 'description': '',
@@ -1336,8 +1759,7 @@ if PYQT_AVAILABLE:
             )
             if file_path:
                 try:
-                    with open(file_path, 'r') as f:
-                        self.current_project = json.load(f)
+                    self.current_project = _json_loads(Path(file_path).read_bytes())
 
                     self.project_name_line.setText(self.current_project.get('name', ''))
                     self.project_desc_line.setText(self.current_project.get('description', ''))
@@ -1359,12 +1781,9 @@ if PYQT_AVAILABLE:
                 self, "Save Project", "", "Project Files (*.pyobf);;JSON Files (*.json)"
             )
             if file_path:
-                try:
-                    with open(file_path, 'w') as f:
-                        json.dump(self.current_project, f, indent=2)
-                    QMessageBox.information(self, "Success", "Project saved successfully!")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to save project: {str(e)}")
+                self.run_in_background(partial(_save_json, file_path, dict(self.current_project)),
+                                       "Project saved successfully!", "Failed to save project",
+                                       self.save_project_button)
 
         def update_project_tree(self):
             """Update the project files tree"""
@@ -1385,8 +1804,7 @@ if PYQT_AVAILABLE:
             )
             if file_path:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        self.code_entry.setText(f.read())
+                    self.code_entry.setPlainText(_read_source(file_path))
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to load file: {str(e)}")
 
@@ -1413,16 +1831,14 @@ if PYQT_AVAILABLE:
                 self, "Save Obfuscated Data", "", "JSON Files (*.json);;All Files (*)"
             )
             if file_path:
-                try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(self.obfuscation_result, f, indent=2, default=str)
-                    QMessageBox.information(self, "Success", "Obfuscated data saved successfully!")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to save file: {str(e)}")
+                self.ensure_standalone_code()
+                self.run_in_background(partial(_write_json, file_path, dict(self.obfuscation_result)),
+                                       "Obfuscated data saved successfully!", "Failed to save file",
+                                       self.save_obfuscated_button)
 
         def save_standalone(self):
             """Save standalone executable code"""
-            if not self.obfuscation_result or 'standalone_code' not in self.obfuscation_result:
+            if not self.obfuscation_result or not self.ensure_standalone_code():
                 QMessageBox.warning(self, "Warning", "No standalone code to save.")
                 return
 
@@ -1430,12 +1846,9 @@ if PYQT_AVAILABLE:
                 self, "Save Standalone Code", "", "Python Files (*.py);;All Files (*)"
             )
             if file_path:
-                try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(self.obfuscation_result['standalone_code'])
-                    QMessageBox.information(self, "Success", "Standalone code saved successfully!")
-                except Exception as e:
-                    QMessageBox.critical(self, "Error", f"Failed to save file: {str(e)}")
+                self.run_in_background(partial(_write_text, file_path, self.obfuscation_result['standalone_code']),
+                                       "Standalone code saved successfully!", "Failed to save file",
+                                       self.save_standalone_button)
 
         def load_obfuscated_file(self):
             """Load obfuscated data file"""
@@ -1444,8 +1857,7 @@ if PYQT_AVAILABLE:
             )
             if file_path:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        self.obfuscated_input.setText(f.read())
+                    self.obfuscated_input.setPlainText(_read_source(file_path))
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Failed to load file: {str(e)}")
 
@@ -1588,7 +2000,7 @@ if PYQT_AVAILABLE:
                     self.combine_status_label.setText("Obfuscating combined file...")
                     log_messages.append("🔒 Starting obfuscation...")
 
-                    obfuscator = Obfuscator()
+                    obfuscator = _shared_obfuscator()
                     technique = self.combine_technique_combo.currentText()
                     layers = self.combine_layers_spinbox.value()
 
@@ -1679,6 +2091,10 @@ def main() -> int:
         print("Install with: pip install PyQt6", file=sys.stderr)
         return 1
 
+    # Required for the batch process pool in frozen (PyInstaller) builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     app = QApplication(sys.argv)
     window = ObfuscatorGUI()
     window.show()
@@ -5,23 +5,141 @@ Provides a Flask-based web interface for ObfusLite obfuscation functionality.
 """
 
 import os
+import sys
+import atexit
+import gzip
 import json
+import multiprocessing
+import shutil
 import tempfile
 import subprocess
 import webbrowser
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
 
 try:
-    from flask import Flask, render_template, request, jsonify, send_from_directory, redirect, url_for
+    from flask import Flask, Response, render_template, request, jsonify, send_from_directory, redirect, url_for
     from flask_cors import CORS
     FLASK_AVAILABLE = True
 except ImportError:
     FLASK_AVAILABLE = False
 
+# Optional fast JSON serializer
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
 from . import Obfuscator, get_available_techniques, get_fast_techniques, __version__
 
+# Worker processes that run obfuscations outside the request threads
+OBFUSCATION_MAX_WORKERS = os.cpu_count() or 1
+
+# Seconds a request waits for its obfuscation before giving up
+OBFUSCATION_TIMEOUT = 300
+
+# JSON responses smaller than this are sent uncompressed
+GZIP_MIN_SIZE = 1024
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj as compact UTF-8 JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects some values (e.g. integers wider than 64 bits)
+            pass
+    return json.dumps(obj, separators=(',', ':'), default=str).encode('utf-8')
+
+
+@lru_cache(maxsize=1)
+def _obfuscation_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by all obfuscation requests"""
+    return ProcessPoolExecutor(max_workers=OBFUSCATION_MAX_WORKERS,
+                               mp_context=multiprocessing.get_context('spawn'))
+
+
+@atexit.register
+def _shutdown_obfuscation_pool() -> None:
+    """Discard the obfuscation pool, if started, and stop its workers
+
+    A task that is already running cannot be cancelled, so the worker
+    processes are terminated; tasks still running in the pool fail and the
+    next request starts a fresh pool.
+    """
+    if not _obfuscation_pool.cache_info().currsize:
+        return
+    pool = _obfuscation_pool()
+    _obfuscation_pool.cache_clear()
+    
+    # The executor has no public way to stop running workers before 3.14
+    processes = list((pool._processes or {}).values())
+    if sys.version_info >= (3, 9):
+        pool.shutdown(wait=False, cancel_futures=True)
+    else:
+        pool.shutdown(wait=False)
+    for process in processes:
+        process.terminate()
+
+
+@lru_cache(maxsize=1)
+def _shared_obfuscator() -> Obfuscator:
+    """Return the Obfuscator reused by every request handled in this process"""
+    return Obfuscator()
+
+
+def _obfuscate_config(config: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Obfuscate the code described by config and build its standalone file
+
+    Runs in a worker process, so it only takes and returns picklable data.
+    """
+    obfuscator = _shared_obfuscator()
+
+    # Get code to obfuscate
+    if config['script_location']:
+        with open(config['script_location'], 'r', encoding='utf-8') as f:
+            code = f.read()
+    else:
+        code = config['code_input']
+
+    # Perform obfuscation
+    result = obfuscator.obfuscate(
+        code,
+        technique=config['technique'],
+        layers=config['layers'],
+        seed=config['seed']
+    )
+
+    # Generate standalone code if requested
+    standalone_code = None
+    if config['create_standalone']:
+        standalone_code = obfuscator.create_standalone_file(result)
+
+    return result, standalone_code
+
+
+@lru_cache(maxsize=1)
+def _techniques_json() -> str:
+    """Serialize the technique lists once; they are fixed for the process lifetime"""
+    return json.dumps({
+        'success': True,
+        'techniques': {
+            'fast': get_fast_techniques(),
+            'all': get_available_techniques()
+        }
+    })
+
 
 class ObfusLiteWebServer:
     """Web server for ObfusLite GUI"""
@@ -47,9 +165,28 @@ class ObfusLiteWebServer:
         # Configure Flask
         self.app.config['SECRET_KEY'] = 'obfuslite-web-interface'
         self.app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+        self.app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600  # Let browsers cache static assets
 
         self.setup_routes()
+        self.app.after_request(self.compress_response)
         
+    def compress_response(self, response):
+        """Gzip large JSON responses for clients that accept it"""
+        if (response.mimetype != 'application/json' or
+                response.direct_passthrough or
+                'Content-Encoding' in response.headers or
+                'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+            return response
+
+        data = response.get_data()
+        if len(data) < GZIP_MIN_SIZE:
+            return response
+
+        response.set_data(gzip.compress(data))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+        return response
+
     def setup_routes(self):
         """Setup Flask routes"""
 
@@ -79,13 +216,7 @@ class ObfusLiteWebServer:
         def get_techniques():
             """Get available obfuscation techniques"""
             try:
-                return jsonify({
-                    'success': True,
-                    'techniques': {
-                        'fast': get_fast_techniques(),
-                        'all': get_available_techniques()
-                    }
-                })
+                return Response(_techniques_json(), mimetype='application/json')
             except Exception as e:
                 return jsonify({
                     'success': False,
@@ -219,28 +350,17 @@ class ObfusLiteWebServer:
     def perform_obfuscation(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Perform the actual obfuscation"""
         try:
-            # Initialize obfuscator
-            obfuscator = Obfuscator()
-            
-            # Get code to obfuscate
-            if config['script_location']:
-                with open(config['script_location'], 'r', encoding='utf-8') as f:
-                    code = f.read()
-            else:
-                code = config['code_input']
-            
-            # Perform obfuscation
-            result = obfuscator.obfuscate(
-                code,
-                technique=config['technique'],
-                layers=config['layers'],
-                seed=config['seed']
-            )
-            
-            # Generate standalone code if requested
-            standalone_code = None
-            if config['create_standalone']:
-                standalone_code = obfuscator.create_standalone_file(result)
+            # Obfuscate in a worker process so concurrent requests use separate cores
+            future = _obfuscation_pool().submit(_obfuscate_config, config)
+            try:
+                result, standalone_code = future.result(timeout=OBFUSCATION_TIMEOUT)
+            except FuturesTimeoutError:
+                # Free the stuck worker so later requests don't queue behind it
+                _shutdown_obfuscation_pool()
+                return {
+                    'success': False,
+                    'error': f'Obfuscation timed out after {OBFUSCATION_TIMEOUT} seconds'
+                }
             
             # Save output files
             output_info = self.save_output_files(result, standalone_code, config)
@@ -287,8 +407,8 @@ class ObfusLiteWebServer:
         
         # Save obfuscated data (JSON)
         obfuscated_file = os.path.join(output_dir, f"{base_name}.json")
-        with open(obfuscated_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, default=str)
+        with open(obfuscated_file, 'wb') as f:
+            f.write(_json_dumps(result))
         files_created.append(obfuscated_file)
         
         # Save standalone code if requested
@@ -301,9 +421,7 @@ class ObfusLiteWebServer:
         # Backup original file if requested and we have a script location
         if config['backup_original'] and config['script_location']:
             backup_file = os.path.join(output_dir, f"{base_name}_original.py")
-            with open(config['script_location'], 'r', encoding='utf-8') as src:
-                with open(backup_file, 'w', encoding='utf-8') as dst:
-                    dst.write(src.read())
+            shutil.copyfile(config['script_location'], backup_file)
             files_created.append(backup_file)
         
         return {
@@ -325,10 +443,13 @@ class ObfusLiteWebServer:
             if os.name == 'nt':  # Windows
                 os.startfile(path)
             elif os.name == 'posix':  # macOS and Linux
-                if os.uname().sysname == 'Darwin':  # macOS
-                    subprocess.run(['open', path])
-                else:  # Linux
-                    subprocess.run(['xdg-open', path])
+                opener = 'open' if os.uname().sysname == 'Darwin' else 'xdg-open'
+                # Detach the opener so the request does not wait for it
+                subprocess.Popen([opener, path],
+                                 stdin=subprocess.DEVNULL,
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL,
+                                 start_new_session=True)
         except Exception as e:
             print(f"Could not open file explorer: {e}")
     
@@ -339,6 +460,8 @@ class ObfusLiteWebServer:
         print(f"Starting ObfusLite Web Interface...")
         print(f"Server running at: {url}")
         print(f"Press Ctrl+C to stop the server")
+        if not WAITRESS_AVAILABLE and not self.debug:
+            print("Tip: pip install waitress for a faster production server")
         
         if open_browser:
             # Open browser after a short delay
@@ -356,11 +479,17 @@ class ObfusLiteWebServer:
             threading.Thread(target=open_browser_delayed, daemon=True).start()
         
         try:
-            self.app.run(host=self.host, port=self.port, debug=self.debug, threaded=True)
+            if WAITRESS_AVAILABLE and not self.debug:
+                serve(self.app, host=self.host, port=self.port, threads=8)
+            else:
+                # Debug mode needs Werkzeug's reloader and debugger
+                self.app.run(host=self.host, port=self.port, debug=self.debug, threaded=True)
         except KeyboardInterrupt:
             print("\nShutting down ObfusLite Web Interface...")
         except Exception as e:
             print(f"Server error: {e}")
+        finally:
+            _shutdown_obfuscation_pool()
 
 
 def start_web_interface(host='127.0.0.1', port=5000, debug=False, open_browser=True):
@@ -49,7 +49,7 @@ setup(
     extras_require={
         "gui": ["PyQt6>=6.4.0"],
         "dev": ["pytest>=7.0.0", "pytest-cov>=4.0.0"],
-        "full": ["PyQt6>=6.4.0", "numpy>=1.21.0", "scipy>=1.9.0"],
+        "full": ["PyQt6>=6.4.0", "numpy>=1.21.0", "scipy>=1.9.0", "orjson>=3.6.0", "ijson>=3.1.0"],
     },
     entry_points={
         "console_scripts": [